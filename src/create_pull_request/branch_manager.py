@@ -7,9 +7,11 @@ the TypeScript create-or-update-branch.ts module.
 """
 
 import uuid
-from typing import Optional, List, Tuple
+from typing import Optional, Dict, List, Tuple
 from enum import Enum
 
+from github.Repository import Repository
+
 from .git_command_manager import GitCommandManager
 from .github_helper import GitHubHelper
 from .models import (
@@ -17,9 +19,10 @@ from .models import (
     BranchState,
     CommitMetadata,
     GitIdentity,
+    RemoteDetail,
 )
-from .exceptions import GitCommandError, BranchConflictError
-from .utils import parse_display_name_email
+from .exceptions import GitCommandError, GitRefNotFoundError, BranchConflictError
+from .utils import parse_display_name_email, parse_remote_url, get_remote_url
 
 
 class WorkingBaseType(Enum):
@@ -52,6 +55,10 @@ class BranchManager:
         """
         self.git = git
         self.github = github
+        self._default_identities: Dict[str, GitIdentity] = {}
+        self._origin_remote_detail: Optional[RemoteDetail] = None
+        self._repository_parent: Optional[Repository] = None
+        self._repository_parent_loaded = False
 
     def create_or_update_branch(
         self,
@@ -126,19 +133,20 @@ class BranchManager:
                 print(f"Created commit on {temp_branch}")
 
             # Stash any remaining untracked files
-            stashed = self.git.stash_push(include_untracked=True)
+            # Without add-paths everything was either clean or committed
+            # by 'add -A', so there is nothing left to stash
+            stashed = False
+            if inputs.add_paths:
+                stashed = self.git.stash_push(include_untracked=True)
 
             # Reset working base if it's a branch
             if working_base_type == WorkingBaseType.BRANCH:
-                self.git.checkout(working_base)
-                # Try to reset to remote version
+                # Checkout and reset to the remote version in one step
                 try:
-                    self.git.exec(
-                        ["reset", "--hard", f"origin/{working_base}"],
-                        allow_all_exit_codes=True
-                    )
+                    self.git.checkout(working_base, f"origin/{working_base}")
                 except GitCommandError:
-                    pass  # Continue if remote doesn't exist
+                    # Continue with the local branch if remote doesn't exist
+                    self.git.checkout(working_base)
 
             # Handle rebase if working base differs from target base
             if working_base != base:
@@ -152,9 +160,6 @@ class BranchManager:
                 base
             )
 
-            # Get branch head SHA
-            head_sha = self.git.rev_parse(inputs.branch)
-
             # Build commit metadata if there's a diff
             base_commit = None
             branch_commits = []
@@ -163,14 +168,23 @@ class BranchManager:
                 base_commit = self.git.get_commit(base)
                 branch_commits = self._build_branch_commits(base, inputs.branch)
 
+            # Get branch head SHA
+            # Branch commits are listed tip first, so it's already known
+            if branch_commits:
+                head_sha = branch_commits[0].sha
+            else:
+                head_sha = self.git.rev_parse(inputs.branch)
+
+            # Restore working base, which also moves HEAD off the temp branch
+            self.git.checkout(working_base)
+
             # Cleanup temporary branch
             try:
                 self.git.branch_delete(temp_branch, force=True)
             except GitCommandError:
                 pass  # Best effort cleanup
 
-            # Restore working base and stash
-            self.git.checkout(working_base)
+            # Restore stash
             if stashed:
                 try:
                     self.git.stash_pop()
@@ -187,15 +201,15 @@ class BranchManager:
             )
 
         except Exception as e:
-            # Cleanup on error
+            # Try to restore working state
             try:
-                self.git.branch_delete(temp_branch, force=True)
+                self.git.checkout(working_base)
             except:
                 pass
 
-            # Try to restore working state
+            # Cleanup on error
             try:
-                self.git.checkout(working_base)
+                self.git.branch_delete(temp_branch, force=True)
             except:
                 pass
 
@@ -230,16 +244,22 @@ class BranchManager:
         """
         if identity_str:
             return parse_display_name_email(identity_str)
+
+        # Defaults don't change during a run, so resolve them once
+        if identity_type in self._default_identities:
+            return self._default_identities[identity_type]
+
+        # Use defaults from environment or git config
+        if identity_type == "author":
+            name = self.git.config_get("user.name") or "github-actions[bot]"
+            email = self.git.config_get("user.email") or "github-actions[bot]@users.noreply.github.com"
         else:
-            # Use defaults from environment or git config
-            if identity_type == "author":
-                name = self.git.config_get("user.name") or "github-actions[bot]"
-                email = self.git.config_get("user.email") or "github-actions[bot]@users.noreply.github.com"
-            else:
-                name = "github-actions[bot]"
-                email = "github-actions[bot]@users.noreply.github.com"
+            name = "github-actions[bot]"
+            email = "github-actions[bot]@users.noreply.github.com"
 
-            return GitIdentity(name=name, email=email)
+        identity = GitIdentity(name=name, email=email)
+        self._default_identities[identity_type] = identity
+        return identity
 
     def _rebase_onto_base(
         self,
@@ -264,71 +284,100 @@ class BranchManager:
             self.git.fetch(
                 [f"{target_base}:{target_base}"],
                 "origin",
-                ["--force", "--depth=1"]
+                ["--force", "--depth=1", "--no-tags"]
             )
         except GitCommandError:
             print(f"Warning: Could not fetch {target_base}, using local version")
+            # Without the fetch, target base might not exist locally
+            if not self.git.branch_exists_local(target_base):
+                print(f"Creating local tracking branch for {target_base}")
+                self.git.branch_set(target_base, f"origin/{target_base}")
+
+        # Nothing to rebase if both bases point at the same commit
+        if self.git.is_even(working_base, target_base):
+            print(f"{working_base} and {target_base} are even, skipping rebase")
+            return
 
-        # Checkout target base
-        try:
-            self.git.checkout(target_base)
-        except GitCommandError:
-            # If checkout fails, target base might not exist locally
-            print(f"Creating local tracking branch for {target_base}")
-            self.git.checkout(target_base, f"origin/{target_base}")
-
-        # Get commits to cherry-pick
-        commits = self.git.rev_list(
-            f"{working_base}..{temp_branch}",
-            options=["--reverse"]
-        )
+        # Count commits to rebase; the range itself is passed to git
+        commit_count = self.git.rev_list_count(f"{working_base}..{temp_branch}")
 
-        if not commits:
+        if not commit_count:
             print("No commits to cherry-pick")
-            # Create branch from current point
-            self.git.checkout(temp_branch, target_base)
+            # Create branch from current point; temp_branch may still be
+            # checked out here, which branch_set alone can't move
+            self._reset_branch(temp_branch, target_base)
             return
 
-        print(f"Cherry-picking {len(commits)} commits onto {target_base}")
+        # Replay all commits with a single rebase, dropping any that
+        # become empty on the new base
+        print(f"Rebasing {commit_count} commits onto {target_base}")
+        exit_code, stdout, stderr = self.git.rebase(
+            temp_branch,
+            upstream=working_base,
+            onto=target_base,
+            strategy="recursive",
+            strategy_option="theirs",
+            drop_empty=True,
+            allow_all_exit_codes=True
+        )
 
-        # Cherry-pick each commit
-        for commit in commits:
-            exit_code, stdout, stderr = self.git.cherry_pick(
-                [commit],
-                strategy="recursive",
-                strategy_option="theirs",
-                allow_all_exit_codes=True
-            )
+        if exit_code == 0:
+            return
 
-            # Check if cherry-pick succeeded or commit was empty
-            if exit_code != 0:
-                if CHERRYPICK_EMPTY in stderr:
-                    # Empty commit is okay, skip it
-                    print(f"Skipping empty commit: {commit[:8]}")
-                    # Abort the cherry-pick
-                    self.git.exec(["cherry-pick", "--abort"], allow_all_exit_codes=True)
-                    continue
-                else:
-                    # Real conflict
-                    # Abort cherry-pick
-                    self.git.exec(["cherry-pick", "--abort"], allow_all_exit_codes=True)
-                    raise BranchConflictError(
-                        "cherry-pick",
-                        f"Failed to cherry-pick commit {commit[:8]}: {stderr}"
-                    )
+        # Fall back to cherry-picking to report the conflicting commit
+        self.git.exec(["rebase", "--abort"], allow_all_exit_codes=True)
+
+        # Checkout target base with a detached HEAD so that cherry-picking
+        # doesn't move the local target base branch
+        self.git.checkout_detached(target_base)
+
+        print(f"Cherry-picking {commit_count} commits onto {target_base}")
+
+        # Cherry-pick the whole range in a single invocation
+        exit_code, stdout, stderr = self.git.cherry_pick(
+            [f"{working_base}..{temp_branch}"],
+            strategy="recursive",
+            strategy_option="theirs",
+            allow_all_exit_codes=True
+        )
+
+        # The sequencer stops on the first commit it cannot apply cleanly
+        while exit_code != 0:
+            commit = self._get_cherry_pick_head()
+
+            if CHERRYPICK_EMPTY in stderr:
+                # Empty commit is okay, skip it and resume the sequence
+                print(f"Skipping empty commit: {commit[:8]}")
+                exit_code, stdout, stderr = self.git.exec(
+                    ["cherry-pick", "--skip"],
+                    allow_all_exit_codes=True
+                )
+            else:
+                # Real conflict
+                # Abort cherry-pick
+                self.git.exec(["cherry-pick", "--abort"], allow_all_exit_codes=True)
+                raise BranchConflictError(
+                    "cherry-pick",
+                    f"Failed to cherry-pick commit {commit[:8]}: {stderr}"
+                )
 
         # Update temp branch to point to current HEAD
-        self.git.checkout(temp_branch, "HEAD")
+        # The working tree is already there, so only the ref is moved
+        self.git.branch_set(temp_branch, "HEAD")
 
-        # Re-fetch base for comparison
-        try:
-            self.git.fetch(
-                [f"{target_base}:{target_base}"],
-                "origin",
-                ["--force", "--depth=1"]
-            )
-        except GitCommandError:
-            pass
+    def _get_cherry_pick_head(self) -> str:
+        """
+        Get the commit the in-progress cherry-pick stopped on.
+
+        Returns:
+            Commit SHA, or empty string if no cherry-pick is in progress
+        """
+        exit_code, stdout, _ = self.git.exec(
+            ["rev-parse", "--verify", "CHERRY_PICK_HEAD"],
+            allow_all_exit_codes=True,
+            capture_stderr=False
+        )
+        return stdout.strip() if exit_code == 0 else ""
 
     def _determine_branch_action(
         self,
@@ -350,13 +399,20 @@ class BranchManager:
         Returns:
             Tuple of (action, has_diff_with_base)
         """
-        # Check if branch exists remotely
-        branch_exists_remote = self.git.branch_exists_remote(branch)
+        # Fetch existing branch, which also tells us if it exists remotely
+        try:
+            self.git.fetch([f"{branch}:{branch}"], "origin", ["--force"])
+            branch_exists_remote = True
+        except GitRefNotFoundError:
+            branch_exists_remote = False
+        except GitCommandError:
+            print(f"Warning: Could not fetch existing branch {branch}")
+            branch_exists_remote = self.git.branch_exists_remote(branch)
 
         if not branch_exists_remote:
             # Branch doesn't exist - create it
             print(f"Branch {branch} does not exist remotely, creating...")
-            self.git.checkout(branch, temp_branch)
+            self._reset_branch(branch, temp_branch)
 
             # Check if branch is ahead of base
             has_diff = self.git.is_ahead(base, branch)
@@ -370,18 +426,11 @@ class BranchManager:
             # Branch exists - check if we need to update it
             print(f"Branch {branch} exists remotely, checking for updates...")
 
-            # Fetch existing branch
-            try:
-                self.git.fetch([f"{branch}:{branch}"], "origin", ["--force"])
-            except GitCommandError:
-                print(f"Warning: Could not fetch existing branch {branch}")
-
-            # Checkout existing branch
-            self.git.checkout(branch)
+            # The comparisons below only need refs, so it isn't checked out
 
             # Count commits ahead in both branches
-            branch_commits_ahead = len(self.git.rev_list(f"{base}..{branch}"))
-            temp_commits_ahead = len(self.git.rev_list(f"{base}..{temp_branch}"))
+            branch_commits_ahead = self.git.rev_list_count(f"{base}..{branch}")
+            temp_commits_ahead = self.git.rev_list_count(f"{base}..{temp_branch}")
 
             # Check if there's a diff between current branch and temp branch
             has_diff_to_temp = self.git.has_diff(branch, temp_branch)
@@ -395,19 +444,36 @@ class BranchManager:
 
             if should_reset:
                 print(f"Resetting {branch} to match {temp_branch}")
-                self.git.checkout(branch, temp_branch)
+                self._reset_branch(branch, temp_branch)
+                branch_commits_ahead = temp_commits_ahead
 
             # Check if local branch differs from remote
             needs_push = not self.git.is_even(f"origin/{branch}", branch)
 
-            # Check if branch is ahead of base
-            has_diff_with_base = self.git.is_ahead(base, branch)
+            # Branch is ahead of base if it has any commits base doesn't
+            has_diff_with_base = branch_commits_ahead > 0
 
             if needs_push:
                 return "updated", has_diff_with_base
             else:
                 return "not-updated", has_diff_with_base
 
+    def _reset_branch(self, branch: str, start_point: str) -> None:
+        """
+        Create or reset a branch to a commit.
+        Pushing only needs the ref, so a working tree checkout is avoided
+        unless the branch is the one currently checked out.
+
+        Args:
+            branch: Branch name
+            start_point: Commit the branch should point to
+        """
+        try:
+            self.git.branch_set(branch, start_point)
+        except GitCommandError:
+            # git refuses to move the checked out branch
+            self.git.checkout(branch, start_point)
+
     def _build_branch_commits(
         self,
         base: str,
@@ -421,19 +487,9 @@ class BranchManager:
             branch: Branch ref
 
         Returns:
-            List of CommitMetadata
+            List of CommitMetadata, starting with the branch head
         """
-        commit_shas = self.git.rev_list(f"{base}..{branch}")
-
-        commits = []
-        for sha in commit_shas:
-            try:
-                commit = self.git.get_commit(sha)
-                commits.append(commit)
-            except GitCommandError:
-                print(f"Warning: Could not get commit details for {sha}")
-
-        return commits
+        return self.git.log_commits(f"{base}..{branch}")
 
     def push_branch(
         self,
@@ -461,6 +517,22 @@ class BranchManager:
             set_upstream=True
         )
 
+    def _get_origin_remote_detail(self) -> RemoteDetail:
+        """
+        Get parsed details of the origin remote.
+        The remote URL is read and parsed once per BranchManager.
+
+        Returns:
+            RemoteDetail for origin
+
+        Raises:
+            ConfigurationError: If the remote URL can't be parsed
+        """
+        if self._origin_remote_detail is None:
+            origin_url = self.git.get_remote_url("origin")
+            self._origin_remote_detail = parse_remote_url(origin_url)
+        return self._origin_remote_detail
+
     def configure_fork_push(
         self,
         fork_owner_repo: str,
@@ -479,11 +551,7 @@ class BranchManager:
         Raises:
             ConfigurationError: If fork configuration fails
         """
-        from .utils import parse_remote_url, get_remote_url
-
-        # Get current remote URL and parse it
-        origin_url = self.git.get_remote_url("origin")
-        remote_detail = parse_remote_url(origin_url)
+        remote_detail = self._get_origin_remote_detail()
 
         # Build fork URL
         fork_url = get_remote_url(
@@ -521,7 +589,11 @@ class BranchManager:
         if not self.github:
             return True  # Skip verification if GitHub helper not available
 
-        parent = self.github.get_repository_parent()
+        # Parent doesn't change during a run, so only ask the API once
+        if not self._repository_parent_loaded:
+            self._repository_parent = self.github.get_repository_parent()
+            self._repository_parent_loaded = True
+        parent = self._repository_parent
 
         if not parent:
             # Current repo is not a fork, can't push to fork
@@ -23,6 +23,11 @@ class GitCommandError(CreatePullRequestError):
         )
 
 
+class GitRefNotFoundError(GitCommandError):
+    """Raised when a git command references a ref that doesn't exist on the remote."""
+    pass
+
+
 class GitHubAPIError(CreatePullRequestError):
     """Raised when a GitHub API call fails."""
 
@@ -9,12 +9,61 @@ import subprocess
 import sys
 import os
 import base64
-from typing import List, Optional, Dict, Tuple
+import re
+import shutil
+from typing import List, Optional, Dict, Set, Tuple
 from pathlib import Path
 
 from .models import CommitMetadata, FileChange
-from .exceptions import GitCommandError
-from .utils import parse_git_diff_output
+from .exceptions import GitCommandError, GitRefNotFoundError
+from .utils import parse_git_diff_output_z
+
+
+# Commands that can move HEAD or the current branch
+HEAD_MUTATING_COMMANDS = frozenset([
+    "am",
+    "branch",
+    "checkout",
+    "cherry-pick",
+    "commit",
+    "merge",
+    "pull",
+    "rebase",
+    "reset",
+    "revert",
+    "stash",
+    "switch",
+    "update-ref",
+])
+
+# Commands that can change what a ref resolves to
+REF_MUTATING_COMMANDS = HEAD_MUTATING_COMMANDS | frozenset([
+    "fetch",
+    "push",
+    "remote",
+    "tag",
+])
+
+# cat-file --batch-command serves info and contents requests from one process
+BATCH_COMMAND_MIN_VERSION = (2, 36)
+GIT_VERSION_PATTERN = re.compile(r'git version (\d+)\.(\d+)')
+
+
+def _normalize_config_key(key: str) -> str:
+    """
+    Normalize a config key the way git reports it.
+    Section and variable names are case-insensitive, subsections are not.
+
+    Args:
+        key: Config key (e.g., 'http.https://github.com/.extraHeader')
+
+    Returns:
+        Normalized config key
+    """
+    section, dot, rest = key.partition(".")
+    subsection, subdot, name = rest.rpartition(".")
+    return f"{section.lower()}{dot}{subsection}{subdot}{name.lower()}"
+
 
 
 class GitCommandManager:
@@ -31,13 +80,35 @@ class GitCommandManager:
             working_dir: Working directory for git commands
         """
         self.working_dir = Path(working_dir).resolve()
+        self._working_dir_str = str(self.working_dir)
         self.show_output = os.environ.get("CPR_SHOW_GIT_CMD_OUTPUT", "false").lower() == "true"
+        # Resolve git once rather than searching PATH on every call
+        self._git_bin = shutil.which("git") or "git"
+        # Environment shared by every git process:
+        # - no optional locks, so read-only commands don't write index.lock
+        # - never prompt for credentials in non-interactive runs
+        self._env = {
+            **os.environ,
+            "GIT_OPTIONAL_LOCKS": "0",
+            "GIT_TERMINAL_PROMPT": "0",
+        }
+        self._cat_file_processes: Dict[str, subprocess.Popen] = {}
+        self._batch_command_supported: Optional[bool] = None
+        self._version: Optional[str] = None
+        # Memoized reads, invalidated when a command may change them
+        self._config_cache: Dict[Tuple[str, bool], Optional[str]] = {}
+        self._config_primed = False
+        self._head_cache: Dict[str, Optional[str]] = {}
+        self._ref_cache: Dict[Tuple[str, bool], str] = {}
+        self._local_branches: Optional[Set[str]] = None
 
     def exec(
         self,
         args: List[str],
         allow_all_exit_codes: bool = False,
         env: Optional[Dict[str, str]] = None,
+        capture_stderr: bool = True,
+        capture_stdout: bool = True,
     ) -> Tuple[int, str, str]:
         """
         Execute git command.
@@ -46,6 +117,10 @@ class GitCommandManager:
             args: Git command arguments (e.g., ['status', '--short'])
             allow_all_exit_codes: If True, don't raise exception on non-zero exit
             env: Additional environment variables
+            capture_stderr: If False, discard stderr unless output is shown;
+                for exit-code checks that never read it
+            capture_stdout: If False, discard stdout unless output is shown;
+                for commands run only for their side effects
 
         Returns:
             Tuple of (exit_code, stdout, stderr)
@@ -55,38 +130,51 @@ class GitCommandManager:
         """
         command = ["git"] + args
 
+        if args and args[0] in REF_MUTATING_COMMANDS:
+            self._ref_cache.clear()
+            self._local_branches = None
+            if args[0] in HEAD_MUTATING_COMMANDS:
+                self._head_cache.clear()
+
         # Build environment
-        full_env = os.environ.copy()
-        if env:
-            full_env.update(env)
+        full_env = {**self._env, **env} if env else self._env
 
         # Execute command
         try:
             result = subprocess.run(
-                command,
-                cwd=str(self.working_dir),
+                [self._git_bin] + args,
+                cwd=self._working_dir_str,
                 env=full_env,
-                capture_output=True,
+                stdout=(
+                    subprocess.PIPE if capture_stdout or self.show_output
+                    else subprocess.DEVNULL
+                ),
+                stderr=(
+                    subprocess.PIPE if capture_stderr or self.show_output
+                    else subprocess.DEVNULL
+                ),
                 text=True,
             )
+            stdout = result.stdout or ""
+            stderr = result.stderr or ""
 
             # Show output if debugging enabled
             if self.show_output:
                 print(f"[git] {' '.join(args)}")
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr:
-                    print(result.stderr, file=sys.stderr)
+                if stdout:
+                    print(stdout)
+                if stderr:
+                    print(stderr, file=sys.stderr)
 
             # Check exit code
             if result.returncode != 0 and not allow_all_exit_codes:
                 raise GitCommandError(
                     command=' '.join(command),
                     exit_code=result.returncode,
-                    stderr=result.stderr.strip()
+                    stderr=stderr.strip()
                 )
 
-            return result.returncode, result.stdout, result.stderr
+            return result.returncode, stdout, stderr
 
         except FileNotFoundError:
             raise GitCommandError(
@@ -108,11 +196,13 @@ class GitCommandManager:
         if global_config:
             args.append("--global")
         args.extend([key, value])
-        self.exec(args)
+        self._invalidate_config(key)
+        self.exec(args, capture_stdout=False)
 
     def config_get(self, key: str, global_config: bool = False) -> Optional[str]:
         """
         Get git config value.
+        Values are cached until the key is set or unset through this manager.
 
         Args:
             key: Config key
@@ -121,15 +211,26 @@ class GitCommandManager:
         Returns:
             Config value or None if not set
         """
+        cache_key = (_normalize_config_key(key), global_config)
+        if cache_key in self._config_cache:
+            return self._config_cache[cache_key]
+        if self._config_primed:
+            # The primed snapshot holds every key that is set
+            return None
+
         args = ["config"]
         if global_config:
             args.append("--global")
         args.append(key)
 
-        exit_code, stdout, _ = self.exec(args, allow_all_exit_codes=True)
-        if exit_code == 0:
-            return stdout.strip()
-        return None
+        exit_code, stdout, _ = self.exec(
+            args,
+            allow_all_exit_codes=True,
+            capture_stderr=False
+        )
+        value = stdout.strip() if exit_code == 0 else None
+        self._config_cache[cache_key] = value
+        return value
 
     def try_config_unset(self, key: str, global_config: bool = False) -> bool:
         """
@@ -147,22 +248,79 @@ class GitCommandManager:
             args.append("--global")
         args.append(key)
 
-        exit_code, _, _ = self.exec(args, allow_all_exit_codes=True)
+        self._invalidate_config(key)
+        exit_code, _, _ = self.exec(
+            args,
+            allow_all_exit_codes=True,
+            capture_stderr=False
+        )
         return exit_code == 0
 
+    def prime_config_cache(self) -> None:
+        """
+        Load all config values with a single git config --list.
+        Until a key is next written through this manager, config_get is
+        answered from this snapshot, including keys that are not set.
+        """
+        exit_code, stdout, _ = self.exec(
+            ["config", "--list", "-z", "--show-scope"],
+            allow_all_exit_codes=True
+        )
+        if exit_code != 0:
+            return
+
+        self._config_cache.clear()
+
+        # Records are "scope\0key\nvalue\0"; later values take precedence
+        fields = stdout.split("\0")
+        for scope, entry in zip(fields[0::2], fields[1::2]):
+            key, _, value = entry.partition("\n")
+            self._config_cache[(key, False)] = value
+            if scope == "global":
+                self._config_cache[(key, True)] = value
+
+        self._config_primed = True
+
+    def _invalidate_config(self, key: str) -> None:
+        """
+        Drop cached values for a config key that is about to change.
+
+        Args:
+            key: Config key
+        """
+        normalized_key = _normalize_config_key(key)
+        self._config_cache.pop((normalized_key, False), None)
+        self._config_cache.pop((normalized_key, True), None)
+        self._config_primed = False
+
     def checkout(self, ref: str, start_point: Optional[str] = None) -> None:
         """
         Checkout branch or commit.
-        Uses -B flag to create or reset branch.
+        Uses -B flag to create or reset branch when a start point is given.
 
         Args:
             ref: Branch or ref to checkout
             start_point: Starting point for new branch
         """
-        args = ["checkout", "-B", ref]
+        args = ["checkout", "--quiet"]
         if start_point:
-            args.append(start_point)
-        self.exec(args)
+            args.extend(["-B", ref, start_point])
+        else:
+            args.append(ref)
+        args.append("--")
+        self.exec(args, capture_stdout=False)
+
+    def checkout_detached(self, ref: str) -> None:
+        """
+        Checkout a commit with a detached HEAD.
+
+        Args:
+            ref: Branch or ref to checkout
+        """
+        self.exec(
+            ["checkout", "--quiet", "--detach", ref, "--"],
+            capture_stdout=False
+        )
 
     def cherry_pick(
         self,
@@ -194,6 +352,46 @@ class GitCommandManager:
 
         return self.exec(args, allow_all_exit_codes=allow_all_exit_codes)
 
+    def rebase(
+        self,
+        branch: str,
+        upstream: str,
+        onto: Optional[str] = None,
+        strategy: Optional[str] = None,
+        strategy_option: Optional[str] = None,
+        drop_empty: bool = False,
+        allow_all_exit_codes: bool = False
+    ) -> Tuple[int, str, str]:
+        """
+        Rebase branch onto another base.
+
+        Args:
+            branch: Branch to rebase (checked out by git)
+            upstream: Upstream the branch's commits are relative to
+            onto: New base for the commits (defaults to upstream)
+            strategy: Merge strategy (e.g., 'recursive')
+            strategy_option: Strategy option (e.g., 'theirs')
+            drop_empty: Drop commits that become empty
+            allow_all_exit_codes: Allow all exit codes
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        args = ["rebase"]
+
+        if onto:
+            args.extend(["--onto", onto])
+        if strategy:
+            args.extend(["--strategy", strategy])
+        if strategy_option:
+            args.extend(["--strategy-option", strategy_option])
+        if drop_empty:
+            args.append("--empty=drop")
+
+        args.extend([upstream, branch])
+
+        return self.exec(args, allow_all_exit_codes=allow_all_exit_codes)
+
     def commit(
         self,
         message: str,
@@ -210,7 +408,7 @@ class GitCommandManager:
             allow_empty: Allow empty commits
             identity: Identity dict with 'name' and 'email'
         """
-        args = ["commit", "-m", message]
+        args = ["commit", "--quiet", "-m", message]
 
         if signoff:
             args.append("--signoff")
@@ -227,7 +425,7 @@ class GitCommandManager:
                 env["GIT_AUTHOR_EMAIL"] = identity["email"]
                 env["GIT_COMMITTER_EMAIL"] = identity["email"]
 
-        self.exec(args, env=env)
+        self.exec(args, env=env, capture_stdout=False)
 
     def fetch(
         self,
@@ -244,8 +442,12 @@ class GitCommandManager:
             remote_name: Remote name
             options: Additional fetch options
             unshallow: Convert shallow clone to complete repo
+
+        Raises:
+            GitRefNotFoundError: If a refspec source doesn't exist on the remote
+            GitCommandError: If the fetch fails for any other reason
         """
-        args = ["fetch"]
+        args = ["fetch", "--quiet"]
 
         if unshallow:
             args.append("--unshallow")
@@ -256,7 +458,12 @@ class GitCommandManager:
         args.append(remote_name)
         args.extend(refspec)
 
-        self.exec(args)
+        try:
+            self.exec(args, capture_stdout=False)
+        except GitCommandError as e:
+            if e.exit_code == 128 and "couldn't find remote ref" in e.stderr:
+                raise GitRefNotFoundError(e.command, e.exit_code, e.stderr)
+            raise
 
     def push(
         self,
@@ -286,11 +493,12 @@ class GitCommandManager:
         if refspec:
             args.append(refspec)
 
-        self.exec(args)
+        self.exec(args, capture_stdout=False)
 
     def rev_parse(self, ref: str, short: bool = False) -> str:
         """
         Get SHA for ref.
+        Results are cached until a command that can move refs is run.
 
         Args:
             ref: Reference to parse (e.g., 'HEAD', 'main')
@@ -299,13 +507,19 @@ class GitCommandManager:
         Returns:
             SHA string
         """
-        args = ["rev-parse"]
+        cache_key = (ref, short)
+        if cache_key in self._ref_cache:
+            return self._ref_cache[cache_key]
+
         if short:
-            args.append("--short")
-        args.append(ref)
+            _, stdout, _ = self.exec(["rev-parse", "--short", ref])
+            sha = stdout.strip()
+        else:
+            # Full SHAs come from the persistent cat-file process
+            sha, _, _ = self.cat_file_check(ref)
 
-        _, stdout, _ = self.exec(args)
-        return stdout.strip()
+        self._ref_cache[cache_key] = sha
+        return sha
 
     def rev_list(
         self,
@@ -327,12 +541,63 @@ class GitCommandManager:
             args.extend(options)
         args.append(expression)
 
-        exit_code, stdout, _ = self.exec(args, allow_all_exit_codes=True)
+        exit_code, stdout, _ = self.exec(
+            args,
+            allow_all_exit_codes=True,
+            capture_stderr=False
+        )
 
-        if exit_code != 0 or not stdout.strip():
+        if exit_code != 0:
             return []
 
-        return [sha.strip() for sha in stdout.strip().split("\n") if sha.strip()]
+        return [sha for sha in stdout.splitlines() if sha]
+
+    def rev_list_count(self, expression: str, limit: Optional[int] = None) -> int:
+        """
+        Count commits without listing them.
+
+        Args:
+            expression: Rev-list expression (e.g., 'main..HEAD')
+            limit: Stop counting after this many commits (optional)
+
+        Returns:
+            Number of commits, or 0 if the expression can't be resolved
+        """
+        args = ["rev-list", "--count"]
+        if limit is not None:
+            args.append(f"--max-count={limit}")
+        args.append(expression)
+
+        exit_code, stdout, _ = self.exec(
+            args,
+            allow_all_exit_codes=True,
+            capture_stderr=False
+        )
+
+        if exit_code != 0 or not stdout.strip():
+            return 0
+
+        return int(stdout.strip())
+
+    def ahead_behind(self, ref1: str, ref2: str) -> Tuple[int, int]:
+        """
+        Count commits unique to each side of two refs.
+
+        Args:
+            ref1: First ref
+            ref2: Second ref
+
+        Returns:
+            Tuple of (commits only in ref1, commits only in ref2)
+
+        Raises:
+            GitCommandError: If either ref can't be resolved
+        """
+        _, stdout, _ = self.exec(
+            ["rev-list", "--left-right", "--count", f"{ref1}...{ref2}"]
+        )
+        left, right = stdout.split()
+        return int(left), int(right)
 
     def has_diff(self, ref1: Optional[str] = None, ref2: Optional[str] = None) -> bool:
         """
@@ -352,7 +617,11 @@ class GitCommandManager:
         elif ref1:
             args.append(ref1)
 
-        exit_code, _, _ = self.exec(args, allow_all_exit_codes=True)
+        exit_code, _, _ = self.exec(
+            args,
+            allow_all_exit_codes=True,
+            capture_stderr=False
+        )
         # Exit code 0 means no diff, 1 means diff exists
         return exit_code == 1
 
@@ -367,7 +636,8 @@ class GitCommandManager:
         Returns:
             True if working directory is dirty
         """
-        args = ["status", "--porcelain"]
+        # -z output is empty exactly when the tree is clean
+        args = ["status", "--porcelain", "-z"]
 
         if include_untracked:
             args.append("--untracked-files=normal")
@@ -379,7 +649,7 @@ class GitCommandManager:
             args.extend(pathspec)
 
         _, stdout, _ = self.exec(args)
-        return len(stdout.strip()) > 0
+        return bool(stdout)
 
     def status(self, options: Optional[List[str]] = None) -> str:
         """
@@ -416,7 +686,7 @@ class GitCommandManager:
         else:
             raise ValueError("Either paths or all_files must be specified")
 
-        self.exec(args)
+        self.exec(args, capture_stdout=False)
 
     def stash_push(self, include_untracked: bool = False) -> bool:
         """
@@ -440,7 +710,7 @@ class GitCommandManager:
 
     def stash_pop(self) -> None:
         """Pop stashed changes."""
-        self.exec(["stash", "pop"])
+        self.exec(["stash", "pop"], capture_stdout=False)
 
     def branch_exists_remote(self, branch: str, remote: str = "origin") -> bool:
         """
@@ -455,7 +725,24 @@ class GitCommandManager:
         """
         args = ["ls-remote", "--heads", remote, f"refs/heads/{branch}"]
         _, stdout, _ = self.exec(args)
-        return len(stdout.strip()) > 0
+        return bool(stdout)
+
+    def list_local_branches(self) -> Set[str]:
+        """
+        List local branches with a single for-each-ref.
+        The result is cached until a command that can move refs is run.
+
+        Returns:
+            Set of branch names
+        """
+        if self._local_branches is None:
+            _, stdout, _ = self.exec(
+                ["for-each-ref", "--format=%(refname)", "refs/heads"]
+            )
+            self._local_branches = {
+                ref[len("refs/heads/"):] for ref in stdout.splitlines() if ref
+            }
+        return self._local_branches
 
     def branch_exists_local(self, branch: str) -> bool:
         """
@@ -467,27 +754,28 @@ class GitCommandManager:
         Returns:
             True if branch exists locally
         """
-        exit_code, _, _ = self.exec(
-            ["rev-parse", "--verify", f"refs/heads/{branch}"],
-            allow_all_exit_codes=True
-        )
-        return exit_code == 0
+        return branch in self.list_local_branches()
 
     def get_current_branch(self) -> Optional[str]:
         """
         Get current branch name.
+        The result is cached until a command moves HEAD.
 
         Returns:
             Branch name or None if detached HEAD
         """
+        if "branch" in self._head_cache:
+            return self._head_cache["branch"]
+
         exit_code, stdout, _ = self.exec(
             ["symbolic-ref", "--short", "HEAD"],
-            allow_all_exit_codes=True
+            allow_all_exit_codes=True,
+            capture_stderr=False
         )
 
-        if exit_code == 0:
-            return stdout.strip()
-        return None
+        branch = stdout.strip() if exit_code == 0 else None
+        self._head_cache["branch"] = branch
+        return branch
 
     def is_ahead(self, base: str, branch: str) -> bool:
         """
@@ -500,8 +788,8 @@ class GitCommandManager:
         Returns:
             True if branch has commits ahead of base
         """
-        commits = self.rev_list(f"{base}..{branch}")
-        return len(commits) > 0
+        # One commit is enough to answer, so don't walk the whole range
+        return self.rev_list_count(f"{base}..{branch}", limit=1) > 0
 
     def is_behind(self, base: str, branch: str) -> bool:
         """
@@ -514,8 +802,8 @@ class GitCommandManager:
         Returns:
             True if branch is behind base
         """
-        commits = self.rev_list(f"{branch}..{base}")
-        return len(commits) > 0
+        # One commit is enough to answer, so don't walk the whole range
+        return self.rev_list_count(f"{branch}..{base}", limit=1) > 0
 
     def is_even(self, ref1: str, ref2: str) -> bool:
         """
@@ -528,13 +816,151 @@ class GitCommandManager:
         Returns:
             True if refs are equal
         """
+        # Refs point to the same commit when neither has unique commits
         try:
-            sha1 = self.rev_parse(ref1)
-            sha2 = self.rev_parse(ref2)
-            return sha1 == sha2
+            return self.ahead_behind(ref1, ref2) == (0, 0)
         except GitCommandError:
             return False
 
+    def cat_file(self, ref: str) -> Tuple[str, str, bytes]:
+        """
+        Read a git object.
+        Requests are served by a long-running git cat-file process
+        that is started on first use and reused for the manager's lifetime.
+
+        Args:
+            ref: Object name or revision (e.g., 'HEAD^{commit}')
+
+        Returns:
+            Tuple of (object_sha, object_type, content)
+
+        Raises:
+            GitCommandError: If the object does not exist
+        """
+        process, sha, object_type, size = self._cat_file_request("contents", ref)
+        # Content is followed by a newline delimiter
+        content = process.stdout.read(size + 1)[:-1]
+        return sha, object_type, content
+
+    def cat_file_check(self, ref: str) -> Tuple[str, str, int]:
+        """
+        Resolve a git object without reading its content.
+        Served by the same long-running cat-file process as cat_file.
+
+        Args:
+            ref: Object name or revision (e.g., 'HEAD', 'main:README.md')
+
+        Returns:
+            Tuple of (object_sha, object_type, size)
+
+        Raises:
+            GitCommandError: If the object does not exist
+        """
+        _, sha, object_type, size = self._cat_file_request("info", ref)
+        return sha, object_type, size
+
+    def get_version(self) -> str:
+        """
+        Get the git version string.
+        git is only asked once per manager.
+
+        Returns:
+            Version string (e.g., 'git version 2.39.5')
+
+        Raises:
+            GitCommandError: If git can't be run
+        """
+        if self._version is None:
+            _, stdout, _ = self.exec(["--version"])
+            self._version = stdout.strip()
+        return self._version
+
+    def _supports_batch_command(self) -> bool:
+        """
+        Check whether git supports cat-file --batch-command.
+        The git version is only queried once.
+
+        Returns:
+            True if git is at least BATCH_COMMAND_MIN_VERSION
+        """
+        if self._batch_command_supported is None:
+            try:
+                version = self.get_version()
+            except GitCommandError:
+                version = ""
+            match = GIT_VERSION_PATTERN.search(version)
+            self._batch_command_supported = bool(match) and (
+                (int(match.group(1)), int(match.group(2))) >= BATCH_COMMAND_MIN_VERSION
+            )
+        return self._batch_command_supported
+
+    def _cat_file_request(
+        self,
+        request: str,
+        ref: str
+    ) -> Tuple[subprocess.Popen, str, str, int]:
+        """
+        Send one request to a persistent cat-file process.
+        Uses a single --batch-command process when git supports it, and
+        otherwise one --batch or --batch-check process per request type.
+
+        Args:
+            request: 'contents' to read the object, 'info' for its header only
+            ref: Object name or revision
+
+        Returns:
+            Tuple of (process, object_sha, object_type, size)
+
+        Raises:
+            GitCommandError: If the object does not exist
+        """
+        if self._supports_batch_command():
+            mode = "--batch-command"
+            line = f"{request} {ref}\n"
+        else:
+            mode = "--batch" if request == "contents" else "--batch-check"
+            line = f"{ref}\n"
+
+        command = f"git cat-file {mode}"
+        process = self._cat_file_processes.get(mode)
+
+        if process is None or process.poll() is not None:
+            try:
+                process = subprocess.Popen(
+                    [self._git_bin, "cat-file", mode],
+                    cwd=self._working_dir_str,
+                    env=self._env,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                raise GitCommandError(
+                    command=command,
+                    exit_code=-1,
+                    stderr="git command not found. Is git installed?"
+                )
+            self._cat_file_processes[mode] = process
+
+        process.stdin.write(line.encode())
+        process.stdin.flush()
+
+        # Header format: "<sha> <type> <size>" or "<ref> missing"
+        header = process.stdout.readline().decode().rstrip("\n")
+        parts = header.rsplit(" ", 2)
+        if len(parts) != 3 or not parts[2].isdigit():
+            raise GitCommandError(
+                command=f"{command} ({ref})",
+                exit_code=128,
+                stderr=header or "cat-file process exited unexpectedly"
+            )
+
+        if self.show_output:
+            print(f"[git] cat-file {mode} {request} {ref}")
+
+        sha, object_type, size = parts
+        return process, sha, object_type, int(size)
+
     def get_commit(self, ref: str) -> CommitMetadata:
         """
         Get detailed commit information.
@@ -545,24 +971,38 @@ class GitCommandManager:
         Returns:
             CommitMetadata with full commit details
         """
-        # Get commit details with custom format
-        format_str = "%H%n%T%n%P%n%s%n%b"
-        _, stdout, _ = self.exec(["show", "-s", f"--format={format_str}", ref])
-
-        lines = stdout.split("\n")
-        sha = lines[0].strip()
-        tree = lines[1].strip()
-        parents = lines[2].strip().split() if lines[2].strip() else []
-        subject = lines[3].strip() if len(lines) > 3 else ""
-        body = "\n".join(lines[4:]).strip() if len(lines) > 4 else ""
-
-        # Get file changes
+        # Read the raw commit object and parse its headers and message
+        sha, _, content = self.cat_file(f"{ref}^{{commit}}")
+        headers, _, raw_message = content.partition(b"\n\n")
+        message = raw_message.decode("utf-8", errors="replace")
+
+        # The tree and parent lines always come first, so stop at the first
+        # other header instead of walking author, committer and signatures
+        tree = ""
+        parents = []
+        rest = headers
+        while rest:
+            line, _, rest = rest.partition(b"\n")
+            key, _, value = line.partition(b" ")
+            if key == b"tree":
+                tree = value.decode("ascii")
+            elif key == b"parent":
+                parents.append(value.decode("ascii"))
+            else:
+                break
+
+        # Subject is the first paragraph joined into one line, like %s
+        subject_lines, _, body = message.lstrip("\n").partition("\n\n")
+        subject = " ".join(line.strip() for line in subject_lines.split("\n")).strip()
+        body = body.strip()
+
+        # Get file changes; -z keeps paths unquoted
         _, diff_output, _ = self.exec(
-            ["diff-tree", "--no-commit-id", "--name-status", "-r", ref]
+            ["diff-tree", "--no-commit-id", "--name-status", "-r", "-z", ref]
         )
 
         changes = []
-        for status, path in parse_git_diff_output(diff_output):
+        for status, path in parse_git_diff_output_z(diff_output):
             changes.append(FileChange(
                 mode="100644",  # Default mode
                 status=status,
@@ -579,6 +1019,54 @@ class GitCommandManager:
             changes=changes
         )
 
+    def log_commits(self, revision_range: str) -> List[CommitMetadata]:
+        """
+        Get detailed information for every commit in a range.
+        Reads all commits and their file changes with a single git log.
+
+        Args:
+            revision_range: Revision range (e.g., 'main..feature')
+
+        Returns:
+            List of CommitMetadata in topological order, newest first
+        """
+        # Each record starts with a separator so the name-status lines that
+        # git log prints after the format stay attached to their commit
+        format_str = "%x1e%H%x00%T%x00%P%x00%s%x00%b%x00"
+        _, stdout, _ = self.exec([
+            "log",
+            f"--format={format_str}",
+            "--topo-order",
+            "--name-status",
+            "--no-renames",
+            "-z",
+            revision_range,
+        ])
+
+        commits = []
+        for record in stdout.split("\x1e")[1:]:
+            sha, tree, parents, subject, body, diff_output = record.split("\x00", 5)
+
+            changes = []
+            for status, path in parse_git_diff_output_z(diff_output):
+                changes.append(FileChange(
+                    mode="100644",  # Default mode
+                    status=status,
+                    path=path
+                ))
+
+            commits.append(CommitMetadata(
+                sha=sha,
+                tree=tree,
+                parents=parents.split(),
+                subject=subject.strip(),
+                body=body.strip(),
+                signed=False,  # Would need to check GPG signature
+                changes=changes
+            ))
+
+        return commits
+
     def show_file_at_ref(self, ref: str, path: str, as_base64: bool = False) -> str:
         """
         Get file content at specific ref.
@@ -591,12 +1079,12 @@ class GitCommandManager:
         Returns:
             File content
         """
-        _, stdout, _ = self.exec(["show", f"{ref}:{path}"])
+        _, _, content = self.cat_file(f"{ref}:{path}")
 
         if as_base64:
-            return base64.b64encode(stdout.encode()).decode()
+            return base64.b64encode(content).decode()
 
-        return stdout
+        return content.decode("utf-8", errors="replace")
 
     def get_remote_url(self, remote: str = "origin") -> str:
         """
@@ -619,7 +1107,7 @@ class GitCommandManager:
             name: Remote name
             url: Remote URL
         """
-        self.exec(["remote", "add", name, url])
+        self.exec(["remote", "add", name, url], capture_stdout=False)
 
     def remote_remove(self, name: str) -> None:
         """
@@ -628,7 +1116,17 @@ class GitCommandManager:
         Args:
             name: Remote name
         """
-        self.exec(["remote", "remove", name])
+        self.exec(["remote", "remove", name], capture_stdout=False)
+
+    def branch_set(self, branch: str, start_point: str) -> None:
+        """
+        Create or reset a branch without checking it out.
+
+        Args:
+            branch: Branch name
+            start_point: Commit the branch should point to
+        """
+        self.exec(["branch", "--force", branch, start_point], capture_stdout=False)
 
     def branch_delete(self, branch: str, force: bool = False) -> None:
         """
@@ -639,4 +1137,14 @@ class GitCommandManager:
             force: Force delete with -D
         """
         flag = "-D" if force else "-d"
-        self.exec(["branch", flag, branch])
+        self.exec(["branch", flag, branch], capture_stdout=False)
+
+    def close(self) -> None:
+        """Stop the persistent cat-file processes that are running."""
+        processes = list(self._cat_file_processes.values())
+        self._cat_file_processes.clear()
+
+        for process in processes:
+            process.stdin.close()
+            process.stdout.close()
+            process.wait()
@@ -6,6 +6,7 @@ including authentication setup and credential management.
 """
 
 import base64
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -15,6 +16,22 @@ from .utils import parse_remote_url
 from .exceptions import ConfigurationError
 
 
+@lru_cache(maxsize=4)
+def _get_auth_header(token: str) -> str:
+    """
+    Build the http.extraheader value for token authentication.
+    The result is cached since the token doesn't change within a run.
+
+    Args:
+        token: GitHub token
+
+    Returns:
+        Header in the form AUTHORIZATION: basic <base64(x-access-token:TOKEN)>
+    """
+    auth_base64 = base64.b64encode(b"x-access-token:" + token.encode()).decode("ascii")
+    return f"AUTHORIZATION: basic {auth_base64}"
+
+
 class GitConfigHelper:
     """
     Manages git configuration state for backup/restore operations.
@@ -55,6 +72,9 @@ class GitConfigHelper:
             # Continue if safe.directory fails (might not be needed)
             pass
 
+        # Read all config values at once to serve the lookups that follow
+        self.git.prime_config_cache()
+
         # Get remote URL
         try:
             self.remote_url = self.git.get_remote_url("origin")
@@ -82,12 +102,7 @@ class GitConfigHelper:
             self.persisted_extraheader = existing
 
         # Set authorization header with token
-        # Format: AUTHORIZATION: basic <base64(x-access-token:TOKEN)>
-        auth_string = f"x-access-token:{token}"
-        auth_base64 = base64.b64encode(auth_string.encode()).decode()
-        header_value = f"AUTHORIZATION: basic {auth_base64}"
-
-        self.git.config(extraheader_key, header_value)
+        self.git.config(extraheader_key, _get_auth_header(token))
 
     def restore(self) -> None:
         """
@@ -122,15 +137,17 @@ class GitConfigHelper:
     def configure_identity(self, name: str, email: str) -> None:
         """
         Configure git user identity.
+        Commits take their identity from the environment (see
+        GitCommandManager.commit), so this is only needed for git commands
+        that read user.name/user.email; values already set are not rewritten.
 
         Args:
             name: User name
             email: User email
         """
-        if name:
-            self.git.config("user.name", name)
-        if email:
-            self.git.config("user.email", email)
+        for key, value in (("user.name", name), ("user.email", email)):
+            if value and self.git.config_get(key) != value:
+                self.git.config(key, value)
 
     def get_remote_detail(self) -> Optional[RemoteDetail]:
         """
@@ -166,12 +183,8 @@ class AuthHelper:
 
         if remote_detail.protocol == GitProtocol.HTTPS:
             # Use extraheader for HTTPS auth
-            auth_string = f"x-access-token:{token}"
-            auth_base64 = base64.b64encode(auth_string.encode()).decode()
-            header_value = f"AUTHORIZATION: basic {auth_base64}"
-
             extraheader_key = f"http.{remote_url}/.extraheader"
-            git.config(extraheader_key, header_value)
+            git.config(extraheader_key, _get_auth_header(token))
 
         # SSH doesn't need token configuration
 
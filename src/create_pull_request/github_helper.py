@@ -6,14 +6,15 @@ updates, and commit management with retry logic and rate limiting.
 """
 
 import time
+from datetime import datetime, timezone
+from urllib.parse import quote
 from typing import List, Optional, Dict
 from github import Github, GithubException, Auth
 from github.PullRequest import PullRequest
 from github.Repository import Repository
 from github.GithubRetry import GithubRetry
-import urllib3
 
-from .models import PROperation, CommitMetadata, GitIdentity
+from .models import GitIdentity
 from .exceptions import GitHubAPIError, AuthenticationError
 
 
@@ -34,24 +35,42 @@ class GitHubHelper:
         Raises:
             AuthenticationError: If authentication fails
         """
+        # PR node IDs seen in API responses, by PR number
+        self._pr_node_ids: Dict[int, str] = {}
+        # Rate limit bucket of the last response sent through _request_json;
+        # PyGithub's own calls are all REST
+        self._rate_limit_resource = "core"
+
         try:
-            # Configure retry logic: 3 retries with exponential backoff
+            # Configure retry logic: 3 retries with exponential backoff.
+            # 429 responses are retried after their Retry-After delay, and
+            # PATCH (PR edits, ref and milestone updates) is retried along
+            # with the methods GithubRetry already allows. POST is left out
+            # because creating PRs, commits, labels or reviewers isn't safe
+            # to repeat after a write the server may already have applied.
             retry = GithubRetry(
                 total=3,
                 backoff_factor=2,
-                status_forcelist=(500, 502, 503, 504)
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=GithubRetry.DEFAULT_ALLOWED_METHODS | {"PATCH"}
             )
 
-            # Initialize GitHub client with auth
+            # Initialize GitHub client with auth; larger pages mean fewer
+            # requests when listing pull requests
             auth = Auth.Token(token)
-            self.github = Github(auth=auth, retry=retry)
+            self.github = Github(
+                auth=auth,
+                retry=retry,
+                per_page=100
+            )
 
             # Get repository
             self.repo: Repository = self.github.get_repo(repo_full_name)
             self.repo_full_name = repo_full_name
 
-            # Test authentication by getting repo info
-            _ = self.repo.id
+            # get_repo loads the full repository, which also verifies the
+            # token; owner and parent are read from that data without
+            # further requests
 
         except GithubException as e:
             if e.status == 401:
@@ -87,6 +106,8 @@ class GitHubHelper:
         Raises:
             GitHubAPIError: If PR creation/update fails
         """
+        self.check_rate_limit()
+
         try:
             # Try to create PR
             pr = self.repo.create_pull(
@@ -97,6 +118,7 @@ class GitHubHelper:
                 draft=draft,
                 maintainer_can_modify=maintainer_can_modify
             )
+            self._pr_node_ids[pr.number] = pr.node_id
             return pr
 
         except GithubException as e:
@@ -106,6 +128,7 @@ class GitHubHelper:
                 pr = self._find_existing_pr(branch, base)
                 if pr:
                     pr.edit(title=title, body=body)
+                    self._pr_node_ids[pr.number] = pr.node_id
                     return pr
                 else:
                     raise GitHubAPIError(
@@ -115,6 +138,26 @@ class GitHubHelper:
             else:
                 raise GitHubAPIError("create_pull_request", str(e))
 
+    def _get_pr_node_id(self, pr_number: int) -> Optional[str]:
+        """
+        Get a pull request's GraphQL node ID.
+
+        PRs created or updated by this helper are answered from their
+        earlier response; others are fetched once.
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            Node ID, or None if the response has none
+        """
+        if pr_number not in self._pr_node_ids:
+            pr_data = self._request_json(
+                "GET", f"/repos/{self.repo_full_name}/pulls/{pr_number}"
+            )
+            self._pr_node_ids[pr_number] = pr_data.get("node_id")
+        return self._pr_node_ids[pr_number]
+
     def _find_existing_pr(self, head: str, base: str) -> Optional[PullRequest]:
         """
         Find existing pull request by head and base branches.
@@ -184,34 +227,40 @@ class GitHubHelper:
         Raises:
             GitHubAPIError: If update fails
         """
-        try:
-            pr = self.repo.get_pull(pr_number)
+        issue_url = f"/repos/{self.repo_full_name}/issues/{pr_number}"
 
-            # Add labels
+        self.check_rate_limit()
+
+        try:
+            # PRs are issues, so labels, assignees and milestone are applied
+            # through the issue endpoints without loading the PR or issue.
+            # Labels and assignees are added rather than set, so any already
+            # on the PR are kept.
             if labels:
-                issue = self.repo.get_issue(pr_number)
-                issue.add_to_labels(*labels)
+                self._request_json("POST", f"{issue_url}/labels", {"labels": labels})
 
-            # Add assignees
             if assignees:
-                issue = self.repo.get_issue(pr_number)
-                issue.add_to_assignees(*assignees)
+                self._request_json(
+                    "POST",
+                    f"{issue_url}/assignees",
+                    {"assignees": assignees}
+                )
+
+            # Set milestone; the API takes the milestone number directly
+            if milestone and milestone > 0:
+                self._request_json("PATCH", issue_url, {"milestone": milestone})
 
             # Request reviewers
             if reviewers or team_reviewers:
-                reviewer_list = reviewers or []
-                team_reviewer_list = team_reviewers or []
-                pr.create_review_request(
-                    reviewers=reviewer_list,
-                    team_reviewers=team_reviewer_list
+                self._request_json(
+                    "POST",
+                    f"/repos/{self.repo_full_name}/pulls/{pr_number}/requested_reviewers",
+                    {
+                        "reviewers": reviewers or [],
+                        "team_reviewers": team_reviewers or []
+                    }
                 )
 
-            # Set milestone
-            if milestone and milestone > 0:
-                issue = self.repo.get_issue(pr_number)
-                milestone_obj = self.repo.get_milestone(milestone)
-                issue.edit(milestone=milestone_obj)
-
         except GithubException as e:
             raise GitHubAPIError("update_pull_request_metadata", str(e))
 
@@ -227,9 +276,7 @@ class GitHubHelper:
             GitHubAPIError: If conversion fails
         """
         try:
-            # Get PR to get node_id
-            pr = self.repo.get_pull(pr_number)
-            node_id = pr.raw_data.get('node_id')
+            node_id = self._get_pr_node_id(pr_number)
 
             if not node_id:
                 raise GitHubAPIError(
@@ -275,26 +322,38 @@ class GitHubHelper:
             Query result
         """
         # PyGithub doesn't have built-in GraphQL support
-        # We need to use the underlying requester
-        import json
-
-        headers = {
-            "Authorization": f"token {self.github._Github__requester.auth.token}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "query": query,
             "variables": variables
         }
 
-        response = self.github._Github__requester.requestJsonAndCheck(
-            "POST",
-            "https://api.github.com/graphql",
-            input=payload,
-            headers=headers
-        )
+        return self._request_json("POST", "/graphql", payload)
 
+    def _request_json(self, verb: str, url: str, payload: Optional[Dict] = None) -> Dict:
+        """
+        Send a request through PyGithub's underlying requester.
+        The requester adds the token itself and keeps the persistent
+        connection used by REST calls. Relative URLs resolve against the
+        API host and reuse that connection; absolute URLs may be given a
+        new one.
+
+        Args:
+            verb: HTTP method
+            url: API path (e.g., '/repos/owner/repo/git/commits')
+            payload: JSON request body
+
+        Returns:
+            Decoded response body
+
+        Raises:
+            GithubException: If the request fails
+        """
+        headers, response = self.github._Github__requester.requestJsonAndCheck(
+            verb,
+            url,
+            input=payload
+        )
+        self._rate_limit_resource = headers.get("x-ratelimit-resource", "core")
         return response
 
     def create_signed_commit(
@@ -322,42 +381,41 @@ class GitHubHelper:
             GitHubAPIError: If commit creation fails
         """
         try:
-            from github.InputGitAuthor import InputGitAuthor
-            from datetime import datetime
+            # Author and committer share one UTC timestamp
+            now = datetime.now(timezone.utc).isoformat()
 
             # Create author object
-            git_author = InputGitAuthor(
-                name=author.name,
-                email=author.email,
-                date=datetime.now().isoformat()
-            )
+            git_author = {
+                "name": author.name,
+                "email": author.email,
+                "date": now
+            }
 
             # Create committer object
             if committer:
-                git_committer = InputGitAuthor(
-                    name=committer.name,
-                    email=committer.email,
-                    date=datetime.now().isoformat()
-                )
+                git_committer = {
+                    "name": committer.name,
+                    "email": committer.email,
+                    "date": now
+                }
             else:
                 git_committer = git_author
 
-            # Get tree object
-            tree = self.repo.get_git_tree(tree_sha)
-
-            # Get parent commits
-            parents = [self.repo.get_git_commit(sha) for sha in parent_shas]
-
-            # Create commit
-            commit = self.repo.create_git_commit(
-                message=message,
-                tree=tree,
-                parents=parents,
-                author=git_author,
-                committer=git_committer
+            # The API takes the tree and parent SHAs directly, so they
+            # don't need to be fetched as objects first
+            commit = self._request_json(
+                "POST",
+                f"/repos/{self.repo_full_name}/git/commits",
+                {
+                    "message": message,
+                    "tree": tree_sha,
+                    "parents": parent_shas,
+                    "author": git_author,
+                    "committer": git_committer
+                }
             )
 
-            return commit.sha
+            return commit["sha"]
 
         except GithubException as e:
             raise GitHubAPIError("create_signed_commit", str(e))
@@ -383,11 +441,18 @@ class GitHubHelper:
             full_ref = f"refs/{ref}" if not ref.startswith("refs/") else ref
 
             try:
-                # Try to update existing ref
-                git_ref = self.repo.get_git_ref(ref)
-                git_ref.edit(sha, force=force)
+                # Update the existing ref in one request
+                self._request_json(
+                    "PATCH",
+                    f"/repos/{self.repo_full_name}/git/{quote(full_ref)}",
+                    {"sha": sha, "force": force}
+                )
             except GithubException as e:
-                if e.status == 404:
+                # GitHub answers 422 "Reference does not exist" for a missing ref
+                missing = e.status == 404 or (
+                    e.status == 422 and "does not exist" in str(e).lower()
+                )
+                if missing:
                     # Ref doesn't exist, create it
                     self.repo.create_git_ref(full_ref, sha)
                 else:
@@ -412,15 +477,23 @@ class GitHubHelper:
 
     def check_rate_limit(self) -> None:
         """
-        Check rate limit and wait if necessary.
+        Check the core (REST) rate limit and wait if necessary.
+        Uses the rate limit headers of the last API response when it came
+        from the core bucket; PyGithub only asks /rate_limit when no
+        request has been made yet. After a GraphQL response, whose headers
+        describe the graphql bucket, the core limit is queried instead.
         """
         try:
-            rate_limit = self.github.get_rate_limit()
-            core_limit = rate_limit.core
+            if self._rate_limit_resource != "core":
+                self.github.get_rate_limit()
+                # The /rate_limit response headers describe the core bucket
+                self._rate_limit_resource = "core"
+
+            remaining, _ = self.github.rate_limiting
 
-            if core_limit.remaining < 10:
+            if remaining < 10:
                 # Wait until reset time
-                wait_time = (core_limit.reset - time.time()) + 10  # Add 10s buffer
+                wait_time = (self.github.rate_limiting_resettime - time.time()) + 10  # Add 10s buffer
                 if wait_time > 0:
                     print(f"Rate limit low, waiting {wait_time:.0f} seconds...")
                     time.sleep(wait_time)
@@ -7,8 +7,7 @@ or update pull requests for repository changes.
 
 import os
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from .models import ActionInputs, ActionOutputs, PROperation
 from .git_command_manager import GitCommandManager
@@ -16,6 +15,8 @@ from .git_config_helper import GitConfigHelper
 from .github_helper import GitHubHelper
 from .branch_manager import BranchManager
 from .utils import (
+    get_input,
+    get_boolean_input,
     get_input_as_array,
     get_repo_path,
     read_file,
@@ -30,6 +31,10 @@ from .exceptions import (
 )
 
 
+# GitHub limit on pull request body length, in characters
+MAX_BODY_LENGTH = 65536
+
+
 def parse_action_inputs() -> ActionInputs:
     """
     Parse GitHub Actions inputs from environment variables.
@@ -41,54 +46,54 @@ def parse_action_inputs() -> ActionInputs:
         ConfigurationError: If required inputs are missing or invalid
     """
     # Required inputs
-    token = os.environ.get("INPUT_TOKEN", "")
+    token = get_input("token")
     if not token:
         raise ConfigurationError("token", "Token is required")
 
     # Repository settings
-    path = os.environ.get("INPUT_PATH", ".")
+    path = get_input("path", ".")
     add_paths = get_input_as_array("add-paths", [])
 
     # Commit settings
-    commit_message = os.environ.get("INPUT_COMMIT-MESSAGE", "")
-    committer = os.environ.get("INPUT_COMMITTER", "")
-    author = os.environ.get("INPUT_AUTHOR", "")
-    signoff = os.environ.get("INPUT_SIGNOFF", "false").lower() == "true"
-    sign_commits = os.environ.get("INPUT_SIGN-COMMITS", "false").lower() == "true"
+    commit_message = get_input("commit-message")
+    committer = get_input("committer")
+    author = get_input("author")
+    signoff = get_boolean_input("signoff")
+    sign_commits = get_boolean_input("sign-commits")
 
     # Branch settings
-    branch = os.environ.get("INPUT_BRANCH", "create-pull-request/patch")
-    branch_suffix = os.environ.get("INPUT_BRANCH-SUFFIX", "none")
-    base = os.environ.get("INPUT_BASE", "")
-    delete_branch = os.environ.get("INPUT_DELETE-BRANCH", "false").lower() == "true"
-    push_to_fork = os.environ.get("INPUT_PUSH-TO-FORK", "")
+    branch = get_input("branch", "create-pull-request/patch")
+    branch_suffix = get_input("branch-suffix", "none")
+    base = get_input("base")
+    delete_branch = get_boolean_input("delete-branch")
+    push_to_fork = get_input("push-to-fork")
 
     # Pull request settings
-    title = os.environ.get("INPUT_TITLE", "Changes by create-pull-request action")
-    body = os.environ.get("INPUT_BODY", "")
-    body_path = os.environ.get("INPUT_BODY-PATH", "")
+    title = get_input("title", "Changes by create-pull-request action")
+    body = get_input("body")
+    body_path = get_input("body-path")
     labels = get_input_as_array("labels", [])
     assignees = get_input_as_array("assignees", [])
     reviewers = get_input_as_array("reviewers", [])
     team_reviewers = get_input_as_array("team-reviewers", [])
 
-    milestone_str = os.environ.get("INPUT_MILESTONE", "0")
+    milestone_str = get_input("milestone", "0")
     try:
         milestone = int(milestone_str)
     except ValueError:
         milestone = 0
 
-    draft_str = os.environ.get("INPUT_DRAFT", "false").lower()
-    draft = draft_str == "true"
+    draft = get_boolean_input("draft")
 
-    maintainer_can_modify = os.environ.get("INPUT_MAINTAINER-CAN-MODIFY", "true").lower() == "true"
+    maintainer_can_modify = get_boolean_input("maintainer-can-modify", True)
 
     # Read body from file if body_path specified
     if body_path and file_exists(body_path):
-        body = read_file(body_path)
+        # One character past the limit is enough to reject the file below
+        body = read_file(body_path, limit=MAX_BODY_LENGTH + 1)
 
     # Validate body length (GitHub limit is 65536 characters)
-    if len(body) > 65536:
+    if len(body) > MAX_BODY_LENGTH:
         raise ConfigurationError("body", "Body exceeds maximum length of 65536 characters")
 
     # Strip org prefix from team reviewers
@@ -121,28 +126,32 @@ def parse_action_inputs() -> ActionInputs:
     )
 
 
-def set_output(name: str, value: str) -> None:
+def set_outputs(outputs: Dict[str, str]) -> None:
     """
-    Set GitHub Actions output.
+    Set GitHub Actions outputs.
+
+    Empty values are skipped.
 
     Args:
-        name: Output name
-        value: Output value
+        outputs: Mapping of output name to value
     """
     # GitHub Actions output format
     github_output = os.environ.get("GITHUB_OUTPUT")
 
     if github_output:
-        # Write to GITHUB_OUTPUT file
+        # Write to GITHUB_OUTPUT file in one append
+        # Use multiline format for safety
+        delimiter = "EOF"
         with open(github_output, "a") as f:
-            # Use multiline format for safety
-            delimiter = "EOF"
-            f.write(f"{name}<<{delimiter}\n")
-            f.write(f"{value}\n")
-            f.write(f"{delimiter}\n")
+            f.writelines([
+                f"{name}<<{delimiter}\n{value}\n{delimiter}\n"
+                for name, value in outputs.items() if value
+            ])
     else:
         # Fallback to stdout format (deprecated but works)
-        print(f"::set-output name={name}::{value}")
+        for name, value in outputs.items():
+            if value:
+                print(f"::set-output name={name}::{value}")
 
 
 def run() -> None:
@@ -160,6 +169,7 @@ def run() -> None:
     9. Apply PR metadata
     10. Set outputs and cleanup
     """
+    git: Optional[GitCommandManager] = None
     config_helper: Optional[GitConfigHelper] = None
     github_helper: Optional[GitHubHelper] = None
 
@@ -182,8 +192,7 @@ def run() -> None:
         git = GitCommandManager(repo_path)
 
         # Verify git is available
-        _, version, _ = git.exec(["--version"])
-        print(f"Git version: {version.strip()}")
+        print(f"Git version: {git.get_version()}")
 
         # Phase 3: Save git config state
         print("\nPhase 3: Saving git configuration...")
@@ -323,9 +332,7 @@ def run() -> None:
         )
 
         # Set GitHub Actions outputs
-        for key, value in outputs.to_dict().items():
-            if value:
-                set_output(key, value)
+        set_outputs(outputs.to_dict())
 
         print("\n=== Action completed successfully ===")
 
@@ -362,6 +369,12 @@ def run() -> None:
             except Exception:
                 pass
 
+        if git:
+            try:
+                git.close()
+            except Exception:
+                pass
+
 
 if __name__ == "__main__":
     run()
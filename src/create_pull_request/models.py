@@ -73,14 +73,14 @@ class ActionInputs:
     maintainer_can_modify: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class GitIdentity:
     """Git user identity (name and email)."""
     name: str
     email: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class RemoteDetail:
     """Git remote repository details."""
     protocol: GitProtocol
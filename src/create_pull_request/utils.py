@@ -6,28 +6,70 @@ Provides parsing, formatting, and helper functions used across modules.
 
 import re
 import os
-import uuid
+import secrets
+import time
+from functools import lru_cache
 from typing import List, Optional, Tuple
-from datetime import datetime
-from pathlib import Path
 
 from .models import GitIdentity, GitProtocol, RemoteDetail
 from .exceptions import ConfigurationError
 
 
+# Pattern: "Name <email@domain.com>"
+DISPLAY_NAME_EMAIL_PATTERN = re.compile(r'^(.+?)\s*<([^>]+)>$')
+
+# Maps the comma separator of list inputs onto newline
+COMMA_TO_NEWLINE = str.maketrans(',', '\n')
+
+# Remote URL patterns
+HTTPS_URL_PATTERN = re.compile(r'^https://(?:[^@]+@)?([^/]+)/(.+?)(\.git)?$')
+SSH_URL_PATTERN = re.compile(r'^git@([^:]+):(.+?)(\.git)?$')
+GIT_URL_PATTERN = re.compile(r'^git://([^/]+)/(.+?)(\.git)?$')
+
+
+def get_input(name: str, default: str = "") -> str:
+    """
+    Get GitHub Actions input.
+    The runner exposes inputs as INPUT_<NAME> with the name upper-cased
+    and spaces (but not hyphens) replaced by underscores.
+
+    Args:
+        name: Input name as declared in action.yml (e.g., 'commit-message')
+        default: Default value if not set
+
+    Returns:
+        Input value
+    """
+    return os.environ.get(f"INPUT_{name.replace(' ', '_').upper()}", default)
+
+
+def get_boolean_input(name: str, default: bool = False) -> bool:
+    """
+    Get GitHub Actions input as boolean.
+
+    Args:
+        name: Input name as declared in action.yml
+        default: Default value if not set
+
+    Returns:
+        True if the input is 'true' (case-insensitive)
+    """
+    return get_input(name, "true" if default else "false").lower() == "true"
+
+
 def get_input_as_array(name: str, default: Optional[List[str]] = None) -> List[str]:
     """
     Parse GitHub Actions input as array.
     Splits by comma or newline and trims whitespace.
 
     Args:
-        name: Environment variable name (with INPUT_ prefix)
+        name: Input name as declared in action.yml
         default: Default value if not set
 
     Returns:
         List of trimmed strings
     """
-    value = os.environ.get(f"INPUT_{name.upper().replace('-', '_')}", "")
+    value = get_input(name)
     if not value:
         return default or []
 
@@ -45,14 +87,16 @@ def get_string_as_array(value: str) -> List[str]:
         List of trimmed non-empty strings
     """
     # Split by comma or newline
-    items = re.split(r'[\n,]+', value)
+    items = value.translate(COMMA_TO_NEWLINE).split('\n')
     # Trim whitespace and filter empty strings
-    return [item.strip() for item in items if item.strip()]
+    return [item for item in (item.strip() for item in items) if item]
 
 
+@lru_cache(maxsize=128)
 def parse_display_name_email(value: str) -> GitIdentity:
     """
     Parse git identity from "Display Name <email@address.com>" format.
+    Results are cached; the returned identity is frozen so they can be shared.
 
     Args:
         value: Identity string in format "Name <email>" or just "Name"
@@ -66,8 +110,7 @@ def parse_display_name_email(value: str) -> GitIdentity:
     if not value:
         raise ConfigurationError("identity", "Identity string cannot be empty")
 
-    # Match pattern: "Name <email@domain.com>"
-    match = re.match(r'^(.+?)\s*<([^>]+)>$', value.strip())
+    match = DISPLAY_NAME_EMAIL_PATTERN.match(value.strip())
 
     if match:
         name = match.group(1).strip()
@@ -96,10 +139,10 @@ def generate_branch_suffix(suffix_type: str, git_manager=None) -> str:
         return ""
     elif suffix_type == "timestamp":
         # Return seconds since epoch (10 digits)
-        return str(int(datetime.now().timestamp()))
+        return str(int(time.time()))
     elif suffix_type == "random":
         # Return 7-character random string
-        return str(uuid.uuid4())[:7]
+        return random_string(7)
     elif suffix_type == "short-commit-hash":
         if git_manager is None:
             raise ConfigurationError("branch-suffix", "Git manager required for short-commit-hash suffix")
@@ -131,9 +174,11 @@ def get_remote_url(protocol: GitProtocol, hostname: str, repository: str) -> str
         raise ConfigurationError("protocol", f"Unsupported protocol: {protocol}")
 
 
+@lru_cache(maxsize=128)
 def parse_remote_url(url: str) -> RemoteDetail:
     """
     Parse git remote URL to extract protocol, hostname, and repository.
+    Results are cached; the returned detail is frozen so they can be shared.
 
     Supports formats:
     - HTTPS: https://[user@]hostname/owner/repo[.git]
@@ -152,7 +197,7 @@ def parse_remote_url(url: str) -> RemoteDetail:
     url = url.strip()
 
     # HTTPS pattern
-    https_match = re.match(r'^https://(?:[^@]+@)?([^/]+)/(.+?)(\.git)?$', url)
+    https_match = HTTPS_URL_PATTERN.match(url)
     if https_match:
         hostname = https_match.group(1)
         repository = https_match.group(2)
@@ -163,7 +208,7 @@ def parse_remote_url(url: str) -> RemoteDetail:
         )
 
     # SSH pattern
-    ssh_match = re.match(r'^git@([^:]+):(.+?)(\.git)?$', url)
+    ssh_match = SSH_URL_PATTERN.match(url)
     if ssh_match:
         hostname = ssh_match.group(1)
         repository = ssh_match.group(2)
@@ -174,7 +219,7 @@ def parse_remote_url(url: str) -> RemoteDetail:
         )
 
     # GIT pattern
-    git_match = re.match(r'^git://([^/]+)/(.+?)(\.git)?$', url)
+    git_match = GIT_URL_PATTERN.match(url)
     if git_match:
         hostname = git_match.group(1)
         repository = git_match.group(2)
@@ -187,25 +232,33 @@ def parse_remote_url(url: str) -> RemoteDetail:
     raise ConfigurationError("remote-url", f"Unable to parse remote URL: {url}")
 
 
-def parse_git_diff_output(output: str) -> List[Tuple[str, str]]:
+def parse_git_diff_output_z(output: str) -> List[Tuple[str, str]]:
     """
-    Parse git diff --name-status output.
+    Parse NUL-delimited git diff --name-status -z output.
+    Paths are not quoted in this format, so names containing tabs,
+    newlines or non-ASCII characters come through unchanged.
 
     Args:
-        output: Output from git diff --name-status
+        output: Output from git diff --name-status -z
 
     Returns:
-        List of (status, path) tuples
+        List of (status, path) tuples; renames and copies report the new path
     """
     files = []
-    for line in output.strip().split("\n"):
-        if not line:
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        # git log -z separates the commit header from the diff with "\0\n"
+        status = fields[i].strip("\n")
+        i += 1
+        if not status:
             continue
-        parts = line.split("\t", maxsplit=1)
-        if len(parts) == 2:
-            status = parts[0]
-            path = parts[1]
-            files.append((status, path))
+        # Renames and copies are followed by both the old and the new path
+        path_count = 2 if status[0] in ("R", "C") else 1
+        if i + path_count > len(fields):
+            break
+        files.append((status, fields[i + path_count - 1]))
+        i += path_count
     return files
 
 
@@ -220,14 +273,8 @@ def strip_org_prefix_from_teams(teams: List[str]) -> List[str]:
     Returns:
         List of team names without org prefix
     """
-    stripped = []
-    for team in teams:
-        if '/' in team:
-            # Take everything after the last slash
-            stripped.append(team.split('/')[-1])
-        else:
-            stripped.append(team)
-    return stripped
+    # Take everything after the last slash; names without one are unchanged
+    return [team.rpartition('/')[2] for team in teams]
 
 
 def get_repo_path(relative_path: Optional[str] = None) -> str:
@@ -244,7 +291,8 @@ def get_repo_path(relative_path: Optional[str] = None) -> str:
     workspace = os.environ.get("GITHUB_WORKSPACE", os.getcwd())
 
     if relative_path:
-        return str(Path(workspace) / relative_path)
+        # normpath keeps the default '.' path from adding a trailing '/.'
+        return os.path.normpath(os.path.join(workspace, relative_path))
 
     return workspace
 
@@ -259,15 +307,18 @@ def file_exists(path: str) -> bool:
     Returns:
         True if file exists, False otherwise
     """
-    return Path(path).is_file()
+    return os.path.isfile(path)
 
 
-def read_file(path: str) -> str:
+def read_file(path: str, limit: Optional[int] = None) -> str:
     """
     Read file contents.
 
     Args:
         path: File path to read
+        limit: Maximum number of characters to read, if any. Callers can
+            read one more than they accept to detect oversized files
+            without loading them in full.
 
     Returns:
         File contents as string
@@ -276,7 +327,10 @@ def read_file(path: str) -> str:
         ConfigurationError: If file doesn't exist or can't be read
     """
     try:
-        return Path(path).read_text(encoding='utf-8')
+        # Text mode keeps universal newline translation; read() with a
+        # limit counts characters after it
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read() if limit is None else f.read(limit)
     except FileNotFoundError:
         raise ConfigurationError("file", f"File not found: {path}")
     except Exception as e:
@@ -317,7 +371,7 @@ def seconds_since_epoch() -> int:
     Returns:
         Integer seconds since epoch (10 digits)
     """
-    return int(datetime.now().timestamp())
+    return int(time.time())
 
 
 def random_string(length: int = 7) -> str:
@@ -328,6 +382,6 @@ def random_string(length: int = 7) -> str:
         length: Length of string to generate
 
     Returns:
-        Random string of specified length
+        Random hex string of specified length
     """
-    return str(uuid.uuid4()).replace('-', '')[:length]
+    return secrets.token_hex((length + 1) // 2)[:length]
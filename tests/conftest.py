@@ -5,6 +5,7 @@ Provides common fixtures for testing git operations and GitHub API interactions.
 """
 
 import os
+import shutil
 import tempfile
 import subprocess
 from pathlib import Path
@@ -12,43 +13,90 @@ from typing import Generator
 import pytest
 
 
+@pytest.fixture(scope="session")
+def template_repo(tmp_path_factory) -> Path:
+    """
+    Create a git repository with one commit, once per test session.
+
+    Returns:
+        Path to template repository
+    """
+    repo_path = tmp_path_factory.mktemp("template") / "repo"
+    repo_path.mkdir()
+
+    # Initialize git repo
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=repo_path,
+        check=True,
+        capture_output=True
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@example.com"],
+        cwd=repo_path,
+        check=True,
+        capture_output=True
+    )
+
+    # Create initial commit
+    (repo_path / "README.md").write_text("# Test Repo\n")
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Initial commit"],
+        cwd=repo_path,
+        check=True,
+        capture_output=True
+    )
+
+    return repo_path
+
+
 @pytest.fixture
-def temp_repo() -> Generator[Path, None, None]:
+def temp_repo(template_repo: Path) -> Generator[Path, None, None]:
     """
     Create a temporary git repository for testing.
+    Each test gets its own copy of the session template, so branches,
+    remotes and config changes don't leak between tests.
 
     Yields:
         Path to temporary repository
     """
     with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = Path(tmpdir)
+        repo_path = Path(tmpdir) / "repo"
+        shutil.copytree(template_repo, repo_path, symlinks=True)
+
+        yield repo_path
 
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+
+@pytest.fixture
+def temp_repo_with_remote(temp_repo: Path) -> Generator[Path, None, None]:
+    """
+    Create a temporary git repository with a bare "origin" remote.
+
+    Yields:
+        Path to temporary repository
+    """
+    with tempfile.TemporaryDirectory() as remote_dir:
         subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=repo_path,
+            ["git", "init", "--bare", remote_dir],
             check=True,
             capture_output=True
         )
         subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=repo_path,
+            ["git", "remote", "add", "origin", remote_dir],
+            cwd=temp_repo,
             check=True,
             capture_output=True
         )
-
-        # Create initial commit
-        (repo_path / "README.md").write_text("# Test Repo\n")
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
         subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=repo_path,
+            ["git", "push", "-u", "origin", "HEAD"],
+            cwd=temp_repo,
             check=True,
             capture_output=True
         )
 
-        yield repo_path
+        yield temp_repo
 
 
 @pytest.fixture
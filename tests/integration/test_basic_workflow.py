@@ -87,6 +87,38 @@ class TestBasicWorkflow:
         commits = git.rev_list("HEAD~3..HEAD")
         assert len(commits) == 3
 
+    def test_log_commits(self, temp_repo):
+        """Test reading commit metadata for a range in one call."""
+        git = GitCommandManager(str(temp_repo))
+        base_sha = git.rev_parse("HEAD")
+
+        (temp_repo / "file1.txt").write_text("Content 1")
+        (temp_repo / "tab\tname.txt").write_text("Content 2")
+        git.add(all_files=True)
+        git.commit(
+            "First\n\nFirst body",
+            identity={"name": "Test", "email": "test@example.com"}
+        )
+        (temp_repo / "README.md").unlink()
+        git.add(all_files=True)
+        git.commit(
+            "Second",
+            identity={"name": "Test", "email": "test@example.com"}
+        )
+
+        commits = git.log_commits(f"{base_sha}..HEAD")
+
+        assert [c.subject for c in commits] == ["Second", "First"]
+        assert commits[0].parents == [commits[1].sha]
+        assert commits[1].parents == [base_sha]
+        assert commits[1].body == "First body"
+        assert [(c.status, c.path) for c in commits[0].changes] == [("D", "README.md")]
+        assert [(c.status, c.path) for c in commits[1].changes] == [
+            ("A", "file1.txt"),
+            ("A", "tab\tname.txt"),
+        ]
+        assert commits == [git.get_commit(c.sha) for c in commits]
+
     def test_branch_ahead_detection(self, temp_repo):
         """Test detecting when branch is ahead of base."""
         git = GitCommandManager(str(temp_repo))
@@ -145,3 +177,184 @@ class TestBranchDiffDetection:
         branch = git.get_current_branch() or "main"
         has_diff = git.has_diff(branch, branch)
         assert has_diff is False
+
+
+class TestCreateOrUpdateBranch:
+    """Tests for BranchManager.create_or_update_branch against a local remote."""
+
+    def test_create_then_update_branch(self, temp_repo_with_remote):
+        """Test the branch is created, left alone, then updated."""
+        repo = temp_repo_with_remote
+        git = GitCommandManager(str(repo))
+        base = git.get_current_branch()
+        base_sha = git.rev_parse("HEAD")
+        branch_manager = BranchManager(git)
+        inputs = ActionInputs(
+            token="fake-token",
+            branch="cpr-test",
+            commit_message="Test changes",
+            base=base
+        )
+
+        # New branch with changes
+        (repo / "change.txt").write_text("one")
+        state = branch_manager.create_or_update_branch(inputs)
+
+        assert state.action == "created"
+        assert state.has_diff_with_base is True
+        assert state.head_sha == git.rev_parse("cpr-test")
+        assert [c.subject for c in state.branch_commits] == ["Test changes"]
+        assert git.get_current_branch() == base
+        assert git.rev_parse("HEAD") == base_sha
+        assert not (repo / "change.txt").exists()
+
+        branch_manager.push_branch("cpr-test")
+
+        # Same changes again - nothing to push
+        (repo / "change.txt").write_text("one")
+        state = branch_manager.create_or_update_branch(inputs)
+
+        assert state.action == "not-updated"
+        assert state.has_diff_with_base is True
+
+        # Different changes - branch is reset to the new commit
+        (repo / "change.txt").write_text("two")
+        state = branch_manager.create_or_update_branch(inputs)
+
+        assert state.action == "updated"
+        assert state.head_sha == git.rev_parse("cpr-test")
+        assert git.show_file_at_ref("cpr-test", "change.txt") == "two"
+        assert git.get_current_branch() == base
+
+    def test_no_changes(self, temp_repo_with_remote):
+        """Test no branch action when there is nothing to commit."""
+        git = GitCommandManager(str(temp_repo_with_remote))
+        inputs = ActionInputs(
+            token="fake-token",
+            branch="cpr-test",
+            base=git.get_current_branch()
+        )
+
+        with patch.object(git, "stash_push", wraps=git.stash_push) as stash_push, \
+                patch.object(git, "stash_pop", wraps=git.stash_pop) as stash_pop:
+            state = BranchManager(git).create_or_update_branch(inputs)
+
+        assert state.action == "none"
+        assert state.has_diff_with_base is False
+        stash_push.assert_not_called()
+        stash_pop.assert_not_called()
+
+    def test_add_paths_stashes_other_changes(self, temp_repo_with_remote):
+        """Test changes outside add-paths are stashed and restored."""
+        repo = temp_repo_with_remote
+        git = GitCommandManager(str(repo))
+        inputs = ActionInputs(
+            token="fake-token",
+            branch="cpr-test",
+            add_paths=["included.txt"],
+            base=git.get_current_branch()
+        )
+        (repo / "included.txt").write_text("included")
+        (repo / "excluded.txt").write_text("excluded")
+
+        state = BranchManager(git).create_or_update_branch(inputs)
+
+        assert state.action == "created"
+        assert [c.path for c in state.branch_commits[0].changes] == ["included.txt"]
+        assert (repo / "excluded.txt").read_text() == "excluded"
+        assert not (repo / "included.txt").exists()
+
+    def test_detached_head(self, temp_repo_with_remote):
+        """Test creating a branch from a detached HEAD cleans up after itself."""
+        repo = temp_repo_with_remote
+        git = GitCommandManager(str(repo))
+        base = git.get_current_branch()
+        head_sha = git.rev_parse("HEAD")
+        git.exec(["checkout", "--detach"])
+        inputs = ActionInputs(token="fake-token", branch="cpr-test", base=base)
+        (repo / "change.txt").write_text("one")
+
+        state = BranchManager(git).create_or_update_branch(inputs)
+
+        assert state.action == "created"
+        assert git.get_current_branch() is None
+        assert git.rev_parse("HEAD") == head_sha
+        _, branches, _ = git.exec(["for-each-ref", "--format=%(refname:short)", "refs/heads"])
+        assert sorted(branches.split()) == sorted([base, "cpr-test"])
+
+    def test_detached_head_behind_base_without_changes(self, temp_repo_with_remote):
+        """Test no branch is created from a detached HEAD behind the base."""
+        repo = temp_repo_with_remote
+        git = GitCommandManager(str(repo))
+        base = git.get_current_branch()
+        (repo / "second.txt").write_text("second")
+        git.add(all_files=True)
+        git.commit("Second commit", identity={"name": "Test", "email": "test@example.com"})
+        git.push("origin", f"HEAD:refs/heads/{base}")
+        git.exec(["checkout", "--detach", f"{base}~1"])
+        inputs = ActionInputs(token="fake-token", branch="cpr-test", base=base)
+
+        state = BranchManager(git).create_or_update_branch(inputs)
+
+        assert state.action == "none"
+        assert state.has_diff_with_base is False
+        _, branches, _ = git.exec(["for-each-ref", "--format=%(refname:short)", "refs/heads"])
+        assert not [b for b in branches.split() if b.startswith("cpr-tmp-")]
+
+    def test_working_base_reset_to_remote(self, temp_repo_with_remote):
+        """Test commits made during the workflow move to the branch."""
+        repo = temp_repo_with_remote
+        git = GitCommandManager(str(repo))
+        base = git.get_current_branch()
+        remote_sha = git.rev_parse("HEAD")
+        inputs = ActionInputs(token="fake-token", branch="cpr-test", base=base)
+
+        # Local commit that was never pushed plus an uncommitted change
+        (repo / "committed.txt").write_text("committed")
+        git.add(all_files=True)
+        git.commit("Local commit", identity={"name": "Test", "email": "test@example.com"})
+        (repo / "uncommitted.txt").write_text("uncommitted")
+
+        state = BranchManager(git).create_or_update_branch(inputs)
+
+        assert state.action == "created"
+        assert [c.subject for c in state.branch_commits] == [
+            "Changes by create-pull-request action",
+            "Local commit",
+        ]
+        assert git.rev_parse(base) == remote_sha
+        assert not (repo / "committed.txt").exists()
+
+    def test_rebase_onto_different_base(self, temp_repo_with_remote):
+        """Test changes made on one branch are proposed against another base."""
+        repo = temp_repo_with_remote
+        git = GitCommandManager(str(repo))
+        identity = {"name": "Test", "email": "test@example.com"}
+        base = git.get_current_branch()
+
+        # Working base "feature" and a base that has moved on since
+        git.checkout("feature", base)
+        (repo / "feature.txt").write_text("feature")
+        git.add(all_files=True)
+        git.commit("Feature commit", identity=identity)
+        git.push(refspec="feature")
+        git.checkout(base)
+        (repo / "base.txt").write_text("base")
+        git.add(all_files=True)
+        git.commit("Base commit", identity=identity)
+        git.push(refspec=base)
+        base_sha = git.rev_parse("HEAD")
+        git.checkout("feature")
+
+        (repo / "change.txt").write_text("change")
+        inputs = ActionInputs(token="fake-token", branch="cpr-test", base=base)
+        state = BranchManager(git).create_or_update_branch(inputs)
+
+        assert state.action == "created"
+        assert [c.subject for c in state.branch_commits] == [
+            "Changes by create-pull-request action"
+        ]
+        assert state.branch_commits[0].parents == [base_sha]
+        assert git.rev_parse(base) == base_sha
+        assert git.get_current_branch() == "feature"
+
@@ -0,0 +1,157 @@
+"""
+Unit tests for BranchManager.
+
+Tests branch operations with a mocked GitCommandManager.
+"""
+
+import pytest
+from unittest.mock import Mock
+from create_pull_request.branch_manager import BranchManager, CHERRYPICK_EMPTY
+from create_pull_request.git_command_manager import GitCommandManager
+from create_pull_request.exceptions import BranchConflictError
+
+
+class TestRebaseOntoBase:
+    """Tests for BranchManager._rebase_onto_base."""
+
+    @pytest.fixture
+    def git(self):
+        """Create mocked GitCommandManager."""
+        git = Mock(spec=GitCommandManager)
+        git.rev_list_count.return_value = 3
+        git.is_even.return_value = False
+        git.rebase.return_value = (1, "", "CONFLICT (content)")
+        git.exec.return_value = (0, "", "")
+        return git
+
+    def test_rebases_in_one_invocation(self, git):
+        """Test all commits are replayed with a single rebase."""
+        git.rebase.return_value = (0, "", "")
+
+        BranchManager(git)._rebase_onto_base("tmp", "feature", "main")
+
+        git.rebase.assert_called_once()
+        assert git.rebase.call_args[0] == ("tmp",)
+        assert git.rebase.call_args[1]["upstream"] == "feature"
+        assert git.rebase.call_args[1]["onto"] == "main"
+        git.cherry_pick.assert_not_called()
+        # rebase switches branches itself; target base is never checked out
+        git.checkout.assert_not_called()
+        git.checkout_detached.assert_not_called()
+
+    def test_failed_rebase_cherry_picks_range_once(self, git):
+        """Test a failed rebase falls back to a single range cherry-pick."""
+        git.cherry_pick.return_value = (0, "", "")
+
+        BranchManager(git)._rebase_onto_base("tmp", "feature", "main")
+
+        assert git.exec.call_args_list[0][0][0] == ["rebase", "--abort"]
+        git.checkout_detached.assert_called_once_with("main")
+        git.cherry_pick.assert_called_once()
+        assert git.cherry_pick.call_args[0][0] == ["feature..tmp"]
+        git.branch_set.assert_called_once_with("tmp", "HEAD")
+
+    def test_skips_empty_commits(self, git):
+        """Test empty commits are skipped and the sequence resumed."""
+        git.cherry_pick.return_value = (1, "", CHERRYPICK_EMPTY)
+        git.exec.side_effect = [
+            (0, "", ""),  # rebase --abort
+            (0, "bbb222\n", ""),  # rev-parse CHERRY_PICK_HEAD
+            (0, "", ""),  # cherry-pick --skip
+        ]
+
+        BranchManager(git)._rebase_onto_base("tmp", "feature", "main")
+
+        assert git.exec.call_args_list[2][0][0] == ["cherry-pick", "--skip"]
+
+    def test_conflict_aborts_and_raises(self, git):
+        """Test a real conflict aborts the cherry-pick and reports the commit."""
+        git.cherry_pick.return_value = (1, "", "CONFLICT (content)")
+        git.exec.side_effect = [
+            (0, "", ""),  # rebase --abort
+            (0, "bbb222\n", ""),  # rev-parse CHERRY_PICK_HEAD
+            (0, "", ""),  # cherry-pick --abort
+        ]
+
+        with pytest.raises(BranchConflictError) as exc_info:
+            BranchManager(git)._rebase_onto_base("tmp", "feature", "main")
+
+        assert "bbb222" in str(exc_info.value)
+        assert git.exec.call_args_list[2][0][0] == ["cherry-pick", "--abort"]
+
+    def test_even_bases_skip_rebase(self, git):
+        """Test nothing is checked out or cherry-picked when bases are even."""
+        git.is_even.return_value = True
+
+        BranchManager(git)._rebase_onto_base("tmp", "feature", "main")
+
+        git.is_even.assert_called_once_with("feature", "main")
+        git.rebase.assert_not_called()
+        git.cherry_pick.assert_not_called()
+
+
+class TestGetIdentity:
+    """Tests for BranchManager._get_identity."""
+
+    def test_explicit_identity(self):
+        """Test an explicit identity string is parsed."""
+        git = Mock(spec=GitCommandManager)
+
+        identity = BranchManager(git)._get_identity("Jane <jane@example.com>", "author")
+
+        assert (identity.name, identity.email) == ("Jane", "jane@example.com")
+        git.config_get.assert_not_called()
+
+    def test_default_author_resolved_once(self):
+        """Test the default author is read from git config only once."""
+        git = Mock(spec=GitCommandManager)
+        git.config_get.side_effect = lambda key: {
+            "user.name": "Test User",
+            "user.email": "test@example.com",
+        }[key]
+        branch_manager = BranchManager(git)
+
+        first = branch_manager._get_identity("", "author")
+        second = branch_manager._get_identity("", "author")
+
+        assert first is second
+        assert (first.name, first.email) == ("Test User", "test@example.com")
+        assert git.config_get.call_count == 2
+
+    def test_default_committer(self):
+        """Test the default committer is the GitHub Actions bot."""
+        git = Mock(spec=GitCommandManager)
+
+        identity = BranchManager(git)._get_identity("", "committer")
+
+        assert identity.name == "github-actions[bot]"
+        git.config_get.assert_not_called()
+
+
+class TestForkPush:
+    """Tests for fork push configuration."""
+
+    def test_origin_url_read_once(self):
+        """Test the origin URL is read and parsed only once."""
+        git = Mock(spec=GitCommandManager)
+        git.get_remote_url.return_value = "https://github.com/owner/repo.git"
+        branch_manager = BranchManager(git)
+
+        branch_manager.configure_fork_push("fork-owner/repo", "token")
+        branch_manager.configure_fork_push("fork-owner/repo", "token")
+
+        git.get_remote_url.assert_called_once_with("origin")
+        git.remote_add.assert_called_with(
+            "fork", "https://github.com/fork-owner/repo.git"
+        )
+
+    def test_repository_parent_fetched_once(self):
+        """Test the fork parent is only requested from the API once."""
+        github = Mock()
+        github.get_repository_parent.return_value = None
+        branch_manager = BranchManager(Mock(spec=GitCommandManager), github)
+
+        assert branch_manager.verify_fork_is_parent("owner/repo") is False
+        assert branch_manager.verify_fork_is_parent("owner/repo") is False
+        github.get_repository_parent.assert_called_once()
+
@@ -4,11 +4,12 @@ Unit tests for GitCommandManager.
 Tests git command execution with mocked subprocess calls.
 """
 
+import subprocess
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from create_pull_request.git_command_manager import GitCommandManager
-from create_pull_request.exceptions import GitCommandError
+from create_pull_request.exceptions import GitCommandError, GitRefNotFoundError
 
 
 class TestGitCommandManager:
@@ -72,21 +73,80 @@ class TestGitCommandManager:
         assert stderr == "error"
 
     @patch('subprocess.run')
-    def test_rev_parse(self, mock_run, git_manager):
-        """Test rev_parse command."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="abc123def456\n",
-            stderr=""
-        )
+    def test_exec_environment(self, mock_run, git_manager):
+        """Test git runs without optional locks or prompts."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
 
-        sha = git_manager.rev_parse("HEAD")
+        git_manager.exec(["status"], env={"GIT_AUTHOR_NAME": "Test"})
 
-        assert sha == "abc123def456"
+        env = mock_run.call_args[1]["env"]
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+        assert env["GIT_AUTHOR_NAME"] == "Test"
+        assert "GIT_AUTHOR_NAME" not in git_manager._env
+
+    @patch('subprocess.run')
+    def test_exec_discards_unread_stderr(self, mock_run, git_manager):
+        """Test exit-code checks don't capture stderr."""
+        mock_run.return_value = Mock(returncode=1, stdout="", stderr=None)
+
+        assert git_manager.has_diff("main", "feature") is True
+        assert mock_run.call_args[1]["stderr"] == subprocess.DEVNULL
+
+        git_manager.exec(["diff", "--quiet"], allow_all_exit_codes=True)
+        assert mock_run.call_args[1]["stderr"] == subprocess.PIPE
+
+    @patch('subprocess.run')
+    def test_exec_discards_unread_stdout(self, mock_run, git_manager):
+        """Test side-effect commands don't capture stdout but keep errors."""
+        mock_run.return_value = Mock(returncode=1, stdout=None, stderr="fatal: bad ref")
+
+        with pytest.raises(GitCommandError) as exc_info:
+            git_manager.branch_set("feature", "missing")
+
+        assert mock_run.call_args[1]["stdout"] == subprocess.DEVNULL
+        assert mock_run.call_args[1]["stderr"] == subprocess.PIPE
+        assert "fatal: bad ref" in str(exc_info.value)
+
+    @patch('subprocess.run')
+    @patch('shutil.which', return_value="/opt/git/bin/git")
+    def test_exec_uses_resolved_git(self, mock_which, mock_run, tmp_path):
+        """Test the git binary is looked up once and reused."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        git_manager = GitCommandManager(str(tmp_path))
+
+        git_manager.exec(["status"])
+        git_manager.exec(["status"])
+
+        mock_which.assert_called_once_with("git")
+        assert mock_run.call_args[0][0] == ["/opt/git/bin/git", "status"]
+
+    @pytest.mark.parametrize("version, expected", [
+        ("git version 2.39.5\n", True),
+        ("git version 2.36.0.windows.1\n", True),
+        ("git version 2.35.8\n", False),
+    ])
+    @patch('subprocess.run')
+    def test_supports_batch_command(self, mock_run, git_manager, version, expected):
+        """Test cat-file --batch-command support is detected from the version once."""
+        mock_run.return_value = Mock(returncode=0, stdout=version, stderr="")
+
+        assert git_manager._supports_batch_command() is expected
+        assert git_manager._supports_batch_command() is expected
+        assert git_manager.get_version() == version.strip()
         mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert "rev-parse" in args
-        assert "HEAD" in args
+
+    def test_rev_parse(self, git_manager):
+        """Test rev_parse resolves through cat-file."""
+        with patch.object(
+            git_manager,
+            "cat_file_check",
+            return_value=("abc123def456", "commit", 200)
+        ) as mock_check:
+            sha = git_manager.rev_parse("HEAD")
+
+        assert sha == "abc123def456"
+        mock_check.assert_called_once_with("HEAD")
 
     @patch('subprocess.run')
     def test_rev_parse_short(self, mock_run, git_manager):
@@ -104,82 +164,183 @@ class TestGitCommandManager:
         assert "--short" in args
 
     @patch('subprocess.run')
-    def test_branch_exists_remote_true(self, mock_run, git_manager):
-        """Test branch_exists_remote when branch exists."""
+    def test_rev_list_count(self, mock_run, git_manager):
+        """Test rev_list_count parses the count output."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="abc123  refs/heads/main\n",
+            stdout="12\n",
             stderr=""
         )
 
-        result = git_manager.branch_exists_remote("main")
+        assert git_manager.rev_list_count("main..feature") == 12
+        args = mock_run.call_args[0][0]
+        assert args[1:] == ["rev-list", "--count", "main..feature"]
+
+    @patch('subprocess.run')
+    def test_rev_list_count_unknown_ref(self, mock_run, git_manager):
+        """Test rev_list_count returns 0 when the range can't be resolved."""
+        mock_run.return_value = Mock(
+            returncode=128,
+            stdout="",
+            stderr="fatal: bad revision"
+        )
 
-        assert result is True
+        assert git_manager.rev_list_count("main..missing") == 0
 
     @patch('subprocess.run')
-    def test_branch_exists_remote_false(self, mock_run, git_manager):
-        """Test branch_exists_remote when branch doesn't exist."""
+    def test_is_ahead_stops_at_first_commit(self, mock_run, git_manager):
+        """Test is_ahead only asks git for a single commit."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="",
+            stdout="1\n",
             stderr=""
         )
 
-        result = git_manager.branch_exists_remote("nonexistent")
-
-        assert result is False
+        assert git_manager.is_ahead("main", "feature") is True
+        args = mock_run.call_args[0][0]
+        assert args[1:] == ["rev-list", "--count", "--max-count=1", "main..feature"]
 
     @patch('subprocess.run')
-    def test_is_dirty_true(self, mock_run, git_manager):
-        """Test is_dirty when working directory has changes."""
+    def test_ahead_behind(self, mock_run, git_manager):
+        """Test ahead_behind parses left/right counts."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout=" M file.txt\n",
+            stdout="2\t5\n",
             stderr=""
         )
 
-        result = git_manager.is_dirty()
+        assert git_manager.ahead_behind("main", "feature") == (2, 5)
+        args = mock_run.call_args[0][0]
+        assert args[1:] == ["rev-list", "--left-right", "--count", "main...feature"]
 
-        assert result is True
+    @pytest.mark.parametrize("stdout, returncode, expected", [
+        ("0\t0\n", 0, True),
+        ("0\t1\n", 0, False),
+        ("", 128, False),
+    ])
+    @patch('subprocess.run')
+    def test_is_even(self, mock_run, git_manager, stdout, returncode, expected):
+        """Test is_even uses a single rev-list call."""
+        mock_run.return_value = Mock(
+            returncode=returncode,
+            stdout=stdout,
+            stderr=""
+        )
+
+        assert git_manager.is_even("origin/main", "main") is expected
+        mock_run.assert_called_once()
 
+    @pytest.mark.parametrize("branch, stdout, expected", [
+        ("main", "abc123  refs/heads/main\n", True),
+        ("nonexistent", "", False),
+    ])
     @patch('subprocess.run')
-    def test_is_dirty_false(self, mock_run, git_manager):
-        """Test is_dirty when working directory is clean."""
+    def test_branch_exists_remote(self, mock_run, git_manager, branch, stdout, expected):
+        """Test branch_exists_remote reports whether ls-remote found the branch."""
         mock_run.return_value = Mock(
             returncode=0,
-            stdout="",
+            stdout=stdout,
             stderr=""
         )
 
-        result = git_manager.is_dirty()
+        assert git_manager.branch_exists_remote(branch) is expected
+
+    @pytest.mark.parametrize("stdout, expected", [
+        (" M file.txt\n", True),
+        ("", False),
+    ])
+    @patch('subprocess.run')
+    def test_is_dirty(self, mock_run, git_manager, stdout, expected):
+        """Test is_dirty reports whether status lists any changes."""
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout=stdout,
+            stderr=""
+        )
 
-        assert result is False
+        assert git_manager.is_dirty() is expected
 
+    @pytest.mark.parametrize("returncode, expected", [
+        (1, True),  # git diff --quiet returns 1 when diff exists
+        (0, False),
+    ])
     @patch('subprocess.run')
-    def test_has_diff_true(self, mock_run, git_manager):
-        """Test has_diff when diff exists."""
+    def test_has_diff(self, mock_run, git_manager, returncode, expected):
+        """Test has_diff follows the exit code of git diff --quiet."""
         mock_run.return_value = Mock(
-            returncode=1,  # git diff --quiet returns 1 when diff exists
+            returncode=returncode,
             stdout="",
             stderr=""
         )
 
-        result = git_manager.has_diff("main", "feature")
+        assert git_manager.has_diff("main", "feature") is expected
 
-        assert result is True
+    @patch('subprocess.run')
+    def test_config_get_cached(self, mock_run, git_manager):
+        """Test config_get reuses values until the key is set."""
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout="Test User\n",
+            stderr=""
+        )
+
+        assert git_manager.config_get("user.name") == "Test User"
+        assert git_manager.config_get("user.name") == "Test User"
+        assert mock_run.call_count == 1
+
+        git_manager.config("user.name", "Other User")
+        git_manager.config_get("user.name")
+        assert mock_run.call_count == 3
 
     @patch('subprocess.run')
-    def test_has_diff_false(self, mock_run, git_manager):
-        """Test has_diff when no diff exists."""
+    def test_rev_parse_head_cached(self, mock_run, git_manager):
+        """Test HEAD lookups are reused until HEAD moves."""
         mock_run.return_value = Mock(
-            returncode=0,  # git diff --quiet returns 0 when no diff
-            stdout="",
+            returncode=0,
+            stdout="abc123d\n",
             stderr=""
         )
 
-        result = git_manager.has_diff("main", "feature")
+        git_manager.rev_parse("HEAD", short=True)
+        git_manager.get_current_branch()
+        git_manager.rev_parse("HEAD", short=True)
+        git_manager.get_current_branch()
+        assert mock_run.call_count == 2
+
+        git_manager.checkout("feature", "HEAD")
+        git_manager.rev_parse("HEAD", short=True)
+        assert mock_run.call_count == 4
+
+    def test_rev_parse_cached_until_refs_change(self, git_manager):
+        """Test ref lookups are reused until a command can move refs."""
+        with patch.object(
+            git_manager,
+            "cat_file_check",
+            return_value=("abc123def456", "commit", 200)
+        ) as mock_check, patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+            git_manager.rev_parse("origin/main")
+            git_manager.rev_parse("origin/main")
+            git_manager.is_dirty()
+            git_manager.rev_parse("origin/main")
+            assert mock_check.call_count == 1
+
+            git_manager.fetch(["main"], "origin")
+            git_manager.rev_parse("origin/main")
+            assert mock_check.call_count == 2
+
+    @patch('subprocess.run')
+    def test_fetch_missing_ref(self, mock_run, git_manager):
+        """Test fetching a ref missing from the remote raises GitRefNotFoundError."""
+        mock_run.return_value = Mock(
+            returncode=128,
+            stdout="",
+            stderr="fatal: couldn't find remote ref feature\n"
+        )
 
-        assert result is False
+        with pytest.raises(GitRefNotFoundError):
+            git_manager.fetch(["feature:feature"], "origin", ["--force"])
 
 
 class TestGitCommandManagerIntegration:
@@ -207,3 +368,68 @@ class TestGitCommandManagerIntegration:
         # Create a file and test is_dirty
         (temp_repo / "new_file.txt").write_text("content")
         assert git.is_dirty(include_untracked=True) is True
+
+    @pytest.mark.parametrize("batch_command, modes", [
+        (True, ["--batch-command"]),
+        (False, ["--batch", "--batch-check"]),
+    ])
+    def test_cat_file(self, temp_repo, batch_command, modes):
+        """Test reading objects through the persistent cat-file process."""
+        git = GitCommandManager(str(temp_repo))
+        git._batch_command_supported = batch_command
+
+        sha, object_type, content = git.cat_file("HEAD")
+        assert object_type == "commit"
+        assert content.startswith(b"tree ")
+        head = git.rev_parse("HEAD")
+        assert head == sha
+
+        # The same process serves subsequent requests
+        process = git._cat_file_processes[modes[0]]
+        _, object_type, content = git.cat_file("HEAD:README.md")
+        assert (object_type, content) == ("blob", b"# Test Repo\n")
+        assert git._cat_file_processes[modes[0]] is process
+
+        with pytest.raises(GitCommandError):
+            git.cat_file("does-not-exist")
+
+        assert git.cat_file_check("HEAD") == (head, "commit", len(git.cat_file("HEAD")[2]))
+        assert git.show_file_at_ref("HEAD", "README.md") == "# Test Repo\n"
+        assert git.show_file_at_ref("HEAD", "README.md", as_base64=True) == "IyBUZXN0IFJlcG8K"
+
+        assert sorted(git._cat_file_processes) == modes
+
+        git.close()
+        assert process.poll() is not None
+        assert git._cat_file_processes == {}
+
+    def test_prime_config_cache(self, temp_repo):
+        """Test config lookups are served from a primed snapshot."""
+        git = GitCommandManager(str(temp_repo))
+        git.prime_config_cache()
+
+        with patch('subprocess.run') as mock_run:
+            assert git.config_get("user.name") == "Test User"
+            assert git.config_get("User.Email") == "test@example.com"
+            assert git.config_get("cpr.missing") is None
+            mock_run.assert_not_called()
+
+        # Writes fall back to reading through git
+        git.config("cpr.Section.key", "value")
+        assert git.config_get("cpr.Section.key") == "value"
+        assert git.config_get("cpr.missing") is None
+
+    def test_list_local_branches(self, temp_repo):
+        """Test local branch checks share one cached for-each-ref."""
+        git = GitCommandManager(str(temp_repo))
+        current = git.get_current_branch()
+
+        assert git.list_local_branches() == {current}
+        with patch('subprocess.run') as mock_run:
+            assert git.branch_exists_local(current) is True
+            assert git.branch_exists_local("feature/x") is False
+            mock_run.assert_not_called()
+
+        # Creating a branch invalidates the cached listing
+        git.branch_set("feature/x", "HEAD")
+        assert git.branch_exists_local("feature/x") is True
@@ -0,0 +1,252 @@
+"""
+Unit tests for GitHubHelper.
+
+Tests GitHub API calls with a mocked PyGithub client.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from github import GithubException
+from create_pull_request.github_helper import GitHubHelper
+from create_pull_request.models import GitIdentity
+
+
+@pytest.fixture
+def helper():
+    """Create GitHubHelper with a mocked Github client."""
+    with patch('create_pull_request.github_helper.Github'):
+        helper = GitHubHelper("token", "owner/repo")
+        helper.github.rate_limiting = (5000, 5000)
+        yield helper
+
+
+class TestClientConfiguration:
+    """Tests for the PyGithub client settings."""
+
+    def test_retry_and_paging(self):
+        """Test rate limited and PATCH requests are retried."""
+        with patch('create_pull_request.github_helper.Github') as mock_github:
+            GitHubHelper("token", "owner/repo")
+
+        kwargs = mock_github.call_args[1]
+        assert 429 in kwargs["retry"].status_forcelist
+        assert {"GET", "PATCH"} <= kwargs["retry"].allowed_methods
+        assert "POST" not in kwargs["retry"].allowed_methods
+        assert kwargs["per_page"] == 100
+
+
+class TestGraphQL:
+    """Tests for GraphQL requests."""
+
+    def test_convert_to_draft(self, helper):
+        """Test GraphQL goes through the authenticated requester."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.side_effect = [
+            ({}, {"node_id": "PR_1"}),
+            ({}, {"data": {"convertPullRequestToDraft": {}}}),
+        ]
+
+        helper.convert_to_draft(1)
+
+        lookup, mutation = requester.requestJsonAndCheck.call_args_list
+        assert lookup[0] == ("GET", "/repos/owner/repo/pulls/1")
+        args, kwargs = mutation
+        assert args == ("POST", "/graphql")
+        assert kwargs["input"]["variables"] == {"pullRequestId": "PR_1"}
+        assert "headers" not in kwargs
+
+    def test_convert_to_draft_after_create(self, helper):
+        """Test a PR created by the helper isn't looked up again."""
+        pr = helper.repo.create_pull.return_value
+        pr.number = 1
+        pr.node_id = "PR_1"
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {"data": {"convertPullRequestToDraft": {}}}
+        )
+
+        helper.create_or_update_pull_request("feature", "main", "Title", "Body")
+        helper.convert_to_draft(1)
+
+        requester.requestJsonAndCheck.assert_called_once()
+        kwargs = requester.requestJsonAndCheck.call_args[1]
+        assert kwargs["input"]["variables"] == {"pullRequestId": "PR_1"}
+
+
+class TestGitData:
+    """Tests for git data API calls."""
+
+    def test_create_signed_commit_posts_shas(self, helper):
+        """Test the commit is created without fetching tree or parents."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = ({}, {"sha": "c0ffee"})
+
+        sha = helper.create_signed_commit(
+            "tree123",
+            ["parent1", "parent2"],
+            "Message",
+            GitIdentity(name="Jane", email="jane@example.com")
+        )
+
+        assert sha == "c0ffee"
+        args, kwargs = requester.requestJsonAndCheck.call_args
+        assert args == ("POST", "/repos/owner/repo/git/commits")
+        assert kwargs["input"]["tree"] == "tree123"
+        assert kwargs["input"]["parents"] == ["parent1", "parent2"]
+        assert kwargs["input"]["committer"] == kwargs["input"]["author"]
+        assert kwargs["input"]["author"]["date"].endswith("+00:00")
+        helper.repo.get_git_tree.assert_not_called()
+        helper.repo.get_git_commit.assert_not_called()
+
+    def test_create_signed_commit_shares_timestamp(self, helper):
+        """Test author and committer get the same date."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = ({}, {"sha": "c0ffee"})
+
+        helper.create_signed_commit(
+            "tree123",
+            ["parent1"],
+            "Message",
+            GitIdentity(name="Jane", email="jane@example.com"),
+            GitIdentity(name="Bot", email="bot@example.com")
+        )
+
+        payload = requester.requestJsonAndCheck.call_args[1]["input"]
+        assert payload["committer"]["name"] == "Bot"
+        assert payload["committer"]["date"] == payload["author"]["date"]
+
+    def test_update_branch_reference(self, helper):
+        """Test an existing ref is updated with a single PATCH."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = ({}, {})
+
+        helper.update_branch_reference("heads/feature", "abc123", force=True)
+
+        args, kwargs = requester.requestJsonAndCheck.call_args
+        assert args == ("PATCH", "/repos/owner/repo/git/refs/heads/feature")
+        assert kwargs["input"] == {"sha": "abc123", "force": True}
+        helper.repo.create_git_ref.assert_not_called()
+
+    def test_update_branch_reference_creates_missing_ref(self, helper):
+        """Test a missing ref is created instead."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.side_effect = GithubException(
+            422, {"message": "Reference does not exist"}, None
+        )
+
+        helper.update_branch_reference("heads/feature", "abc123")
+
+        helper.repo.create_git_ref.assert_called_once_with(
+            "refs/heads/feature", "abc123"
+        )
+
+
+class TestPullRequestMetadata:
+    """Tests for update_pull_request_metadata."""
+
+    def test_applies_metadata_without_lookups(self, helper):
+        """Test metadata is written directly without loading PR, issue or milestone."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = ({}, {})
+
+        helper.update_pull_request_metadata(
+            7,
+            labels=["bug"],
+            assignees=["jane"],
+            reviewers=["joe"],
+            milestone=3
+        )
+
+        calls = [
+            (c[0], c[1]["input"]) for c in requester.requestJsonAndCheck.call_args_list
+        ]
+        assert calls == [
+            (("POST", "/repos/owner/repo/issues/7/labels"), {"labels": ["bug"]}),
+            (("POST", "/repos/owner/repo/issues/7/assignees"), {"assignees": ["jane"]}),
+            (("PATCH", "/repos/owner/repo/issues/7"), {"milestone": 3}),
+            (
+                ("POST", "/repos/owner/repo/pulls/7/requested_reviewers"),
+                {"reviewers": ["joe"], "team_reviewers": []}
+            ),
+        ]
+        helper.repo.get_pull.assert_not_called()
+        helper.repo.get_issue.assert_not_called()
+        helper.repo.get_milestone.assert_not_called()
+
+    def test_labels_only(self, helper):
+        """Test only the requested metadata is sent."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = ({}, {})
+
+        helper.update_pull_request_metadata(7, labels=["bug"])
+
+        requester.requestJsonAndCheck.assert_called_once()
+
+
+class TestRateLimit:
+    """Tests for check_rate_limit."""
+
+    def test_uses_recorded_limit(self, helper):
+        """Test the limit recorded by the client is used without a query."""
+        helper.github.rate_limiting = (4000, 5000)
+
+        helper.check_rate_limit()
+
+        helper.github.get_rate_limit.assert_not_called()
+
+    def test_asks_api_before_first_request(self):
+        """Test /rate_limit is only queried when no response has been seen."""
+        with patch('create_pull_request.github_helper.Github.get_repo'):
+            helper = GitHubHelper("token", "owner/repo")
+
+        def record_headers():
+            # The /rate_limit response records its headers like any other
+            helper.github._Github__requester.rate_limiting = (5000, 5000)
+
+        with patch.object(helper.github, 'get_rate_limit') as mock_get_rate_limit:
+            mock_get_rate_limit.side_effect = record_headers
+            helper.check_rate_limit()
+
+        mock_get_rate_limit.assert_called_once()
+
+    @patch('time.sleep')
+    def test_waits_for_reset(self, mock_sleep, helper):
+        """Test a nearly exhausted limit waits until the reset time."""
+        helper.github.rate_limiting = (1, 5000)
+        helper.github.rate_limiting_resettime = (
+            datetime.now(timezone.utc) + timedelta(seconds=50)
+        ).timestamp()
+
+        helper.check_rate_limit()
+
+        wait_time = mock_sleep.call_args[0][0]
+        assert 55 < wait_time <= 60
+
+    def test_graphql_response_queries_core_limit(self, helper):
+        """Test graphql bucket headers are not mistaken for the core limit."""
+        requester = helper.github._Github__requester
+        requester.requestJsonAndCheck.return_value = (
+            {"x-ratelimit-resource": "graphql"},
+            {"data": {}}
+        )
+
+        helper._execute_graphql("query { viewer { login } }", {})
+        helper.check_rate_limit()
+        helper.check_rate_limit()
+
+        helper.github.get_rate_limit.assert_called_once()
+
+    @patch('time.sleep')
+    def test_checked_before_creating_pull_request(self, mock_sleep, helper):
+        """Test creating a PR waits first when the limit is nearly exhausted."""
+        helper.github.rate_limiting = (1, 5000)
+        helper.github.rate_limiting_resettime = (
+            datetime.now(timezone.utc) + timedelta(seconds=50)
+        ).timestamp()
+
+        helper.create_or_update_pull_request("feature", "main", "Title", "Body")
+
+        mock_sleep.assert_called_once()
+        helper.repo.create_pull.assert_called_once()
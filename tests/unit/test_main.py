@@ -0,0 +1,51 @@
+"""
+Unit tests for action entry point helpers.
+
+Tests output writing and input parsing.
+"""
+
+import pytest
+from create_pull_request.main import set_outputs, parse_action_inputs, MAX_BODY_LENGTH
+from create_pull_request.exceptions import ConfigurationError
+
+
+class TestSetOutputs:
+    """Tests for set_outputs."""
+
+    def test_writes_non_empty_outputs(self, tmp_path, monkeypatch):
+        """Test all non-empty outputs are appended to GITHUB_OUTPUT."""
+        output_file = tmp_path / "output"
+        output_file.write_text("existing<<EOF\nvalue\nEOF\n")
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+
+        set_outputs({"pull-request-number": "7", "pull-request-url": ""})
+
+        assert output_file.read_text() == (
+            "existing<<EOF\nvalue\nEOF\n"
+            "pull-request-number<<EOF\n7\nEOF\n"
+        )
+
+
+class TestParseActionInputs:
+    """Tests for parse_action_inputs."""
+
+    def test_body_path_crlf(self, tmp_path, monkeypatch):
+        """Test a CRLF body file reaches the PR body with plain newlines."""
+        body_file = tmp_path / "body.md"
+        body_file.write_bytes(b"a\r\nb\r\n")
+        monkeypatch.setenv("INPUT_TOKEN", "fake-token")
+        monkeypatch.setenv("INPUT_BODY-PATH", str(body_file))
+
+        assert parse_action_inputs().body == "a\nb\n"
+
+    def test_body_path_too_long(self, tmp_path, monkeypatch):
+        """Test an oversized body file is rejected as an invalid body."""
+        body_file = tmp_path / "body.md"
+        body_file.write_text("a" * (MAX_BODY_LENGTH + 100))
+        monkeypatch.setenv("INPUT_TOKEN", "fake-token")
+        monkeypatch.setenv("INPUT_BODY-PATH", str(body_file))
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            parse_action_inputs()
+
+        assert exc_info.value.parameter == "body"
@@ -4,46 +4,65 @@ Unit tests for utility functions.
 Tests parsing, formatting, and helper functions.
 """
 
+import string
 import pytest
 from create_pull_request.utils import (
+    get_input,
+    get_boolean_input,
+    get_input_as_array,
     get_string_as_array,
     parse_display_name_email,
     parse_remote_url,
     get_remote_url,
     generate_branch_suffix,
+    parse_git_diff_output_z,
     strip_org_prefix_from_teams,
+    read_file,
+    get_repo_path,
 )
 from create_pull_request.models import GitProtocol
 from create_pull_request.exceptions import ConfigurationError
 
 
-class TestGetStringAsArray:
-    """Tests for get_string_as_array function."""
+class TestGetInput:
+    """Tests for action input helpers."""
+
+    def test_hyphenated_name(self, monkeypatch):
+        """Test hyphens are kept in the environment variable name."""
+        monkeypatch.setenv("INPUT_COMMIT-MESSAGE", "Update files")
+        assert get_input("commit-message") == "Update files"
 
-    def test_comma_separated(self):
-        """Test parsing comma-separated strings."""
-        result = get_string_as_array("label1, label2, label3")
-        assert result == ["label1", "label2", "label3"]
+    def test_default(self, monkeypatch):
+        """Test the default is returned when the input is not set."""
+        monkeypatch.delenv("INPUT_BRANCH", raising=False)
+        assert get_input("branch", "main") == "main"
 
-    def test_newline_separated(self):
-        """Test parsing newline-separated strings."""
-        result = get_string_as_array("label1\nlabel2\nlabel3")
-        assert result == ["label1", "label2", "label3"]
+    def test_boolean(self, monkeypatch):
+        """Test boolean inputs are case-insensitive and fall back to the default."""
+        monkeypatch.setenv("INPUT_DRAFT", "True")
+        monkeypatch.delenv("INPUT_MAINTAINER-CAN-MODIFY", raising=False)
+        assert get_boolean_input("draft") is True
+        assert get_boolean_input("maintainer-can-modify", True) is True
 
-    def test_mixed_separators(self):
-        """Test parsing mixed separators."""
-        result = get_string_as_array("label1, label2\nlabel3")
-        assert result == ["label1", "label2", "label3"]
+    def test_array(self, monkeypatch):
+        """Test hyphenated array inputs are read and split."""
+        monkeypatch.setenv("INPUT_TEAM-REVIEWERS", "org/team1, team2")
+        assert get_input_as_array("team-reviewers") == ["org/team1", "team2"]
 
-    def test_empty_string(self):
-        """Test parsing empty string."""
-        result = get_string_as_array("")
-        assert result == []
 
-    def test_whitespace_handling(self):
-        """Test whitespace is trimmed."""
-        result = get_string_as_array("  label1  ,  label2  ")
-        assert result == ["label1", "label2"]
+class TestGetStringAsArray:
+    """Tests for get_string_as_array function."""
+
+    @pytest.mark.parametrize("value, expected", [
+        pytest.param("label1, label2, label3", ["label1", "label2", "label3"], id="comma"),
+        pytest.param("label1\nlabel2\nlabel3", ["label1", "label2", "label3"], id="newline"),
+        pytest.param("label1, label2\nlabel3", ["label1", "label2", "label3"], id="mixed"),
+        pytest.param("", [], id="empty"),
+        pytest.param("  label1  ,  label2  ", ["label1", "label2"], id="whitespace"),
+    ])
+    def test_split(self, value, expected):
+        """Test strings are split on commas and newlines and trimmed."""
+        assert get_string_as_array(value) == expected
 
 
 class TestParseDisplayNameEmail:
@@ -52,88 +71,80 @@ class TestParseDisplayNameEmail:
     def test_full_format(self):
         """Test parsing full name and email."""
         result = parse_display_name_email("John Doe <john@example.com>")
-        assert result.name == "John Doe"
-        assert result.email == "john@example.com"
+        assert (result.name, result.email) == ("John Doe", "john@example.com")
 
     def test_with_extra_spaces(self):
         """Test parsing with extra spaces."""
         result = parse_display_name_email("  John Doe  <  john@example.com  >  ")
-        assert result.name == "John Doe"
-        assert result.email == "john@example.com"
+        assert (result.name, result.email) == ("John Doe", "john@example.com")
 
     def test_name_only(self):
         """Test parsing name without email."""
         result = parse_display_name_email("John Doe")
-        assert result.name == "John Doe"
-        assert result.email == ""
+        assert (result.name, result.email) == ("John Doe", "")
 
     def test_empty_string_raises_error(self):
         """Test empty string raises ConfigurationError."""
         with pytest.raises(ConfigurationError):
             parse_display_name_email("")
 
+    def test_result_cached(self):
+        """Test repeated parses of the same string reuse the result."""
+        first = parse_display_name_email("Jane Doe <jane@example.com>")
+        second = parse_display_name_email("Jane Doe <jane@example.com>")
+        assert first is second
+
 
 class TestParseRemoteUrl:
     """Tests for parse_remote_url function."""
 
-    def test_https_url(self):
-        """Test parsing HTTPS URL."""
-        result = parse_remote_url("https://github.com/owner/repo.git")
-        assert result.protocol == GitProtocol.HTTPS
-        assert result.hostname == "github.com"
-        assert result.repository == "owner/repo"
-
-    def test_https_url_without_git_extension(self):
-        """Test parsing HTTPS URL without .git."""
-        result = parse_remote_url("https://github.com/owner/repo")
-        assert result.protocol == GitProtocol.HTTPS
-        assert result.hostname == "github.com"
-        assert result.repository == "owner/repo"
-
-    def test_https_url_with_user(self):
-        """Test parsing HTTPS URL with user."""
-        result = parse_remote_url("https://user@github.com/owner/repo.git")
-        assert result.protocol == GitProtocol.HTTPS
-        assert result.hostname == "github.com"
-        assert result.repository == "owner/repo"
-
-    def test_ssh_url(self):
-        """Test parsing SSH URL."""
-        result = parse_remote_url("git@github.com:owner/repo.git")
-        assert result.protocol == GitProtocol.SSH
-        assert result.hostname == "github.com"
-        assert result.repository == "owner/repo"
-
-    def test_git_protocol_url(self):
-        """Test parsing git:// URL."""
-        result = parse_remote_url("git://github.com/owner/repo.git")
-        assert result.protocol == GitProtocol.GIT
-        assert result.hostname == "github.com"
-        assert result.repository == "owner/repo"
+    @pytest.mark.parametrize("url, protocol", [
+        pytest.param("https://github.com/owner/repo.git", GitProtocol.HTTPS, id="https"),
+        pytest.param("https://github.com/owner/repo", GitProtocol.HTTPS, id="https-no-git"),
+        pytest.param("https://user@github.com/owner/repo.git", GitProtocol.HTTPS, id="https-user"),
+        pytest.param("git@github.com:owner/repo.git", GitProtocol.SSH, id="ssh"),
+        pytest.param("git://github.com/owner/repo.git", GitProtocol.GIT, id="git"),
+    ])
+    def test_parse(self, url, protocol):
+        """Test supported URL formats are parsed into their components."""
+        result = parse_remote_url(url)
+        assert (result.protocol, result.hostname, result.repository) == (
+            protocol, "github.com", "owner/repo"
+        )
 
     def test_invalid_url_raises_error(self):
         """Test invalid URL raises ConfigurationError."""
         with pytest.raises(ConfigurationError):
             parse_remote_url("invalid://url")
 
+    def test_result_cached(self):
+        """Test repeated parses of the same URL reuse the result."""
+        first = parse_remote_url("https://github.com/owner/repo.git")
+        second = parse_remote_url("https://github.com/owner/repo.git")
+        assert first is second
+
 
 class TestGetRemoteUrl:
     """Tests for get_remote_url function."""
 
-    def test_https_url(self):
-        """Test building HTTPS URL."""
-        result = get_remote_url(GitProtocol.HTTPS, "github.com", "owner/repo")
-        assert result == "https://github.com/owner/repo.git"
-
-    def test_ssh_url(self):
-        """Test building SSH URL."""
-        result = get_remote_url(GitProtocol.SSH, "github.com", "owner/repo")
-        assert result == "git@github.com:owner/repo.git"
-
-    def test_git_url(self):
-        """Test building git:// URL."""
-        result = get_remote_url(GitProtocol.GIT, "github.com", "owner/repo")
-        assert result == "git://github.com/owner/repo.git"
+    @pytest.mark.parametrize("protocol, expected", [
+        (GitProtocol.HTTPS, "https://github.com/owner/repo.git"),
+        (GitProtocol.SSH, "git@github.com:owner/repo.git"),
+        (GitProtocol.GIT, "git://github.com/owner/repo.git"),
+    ])
+    def test_build(self, protocol, expected):
+        """Test URLs are built for each protocol."""
+        assert get_remote_url(protocol, "github.com", "owner/repo") == expected
+
+    @pytest.mark.parametrize("url", [
+        "https://github.com/owner/repo.git",
+        "git@github.com:owner/repo.git",
+        "git://github.com/owner/repo.git",
+    ])
+    def test_round_trip(self, url):
+        """Test canonical URLs are rebuilt unchanged from their parsed form."""
+        parsed = parse_remote_url(url)
+        assert get_remote_url(parsed.protocol, parsed.hostname, parsed.repository) == url
 
 
 class TestGenerateBranchSuffix:
@@ -151,9 +162,10 @@ class TestGenerateBranchSuffix:
         assert len(result) == 10  # Unix timestamp is 10 digits
 
     def test_random_suffix(self):
-        """Test random suffix returns 7-character string."""
+        """Test random suffix returns 7 lowercase hex characters."""
         result = generate_branch_suffix("random")
         assert len(result) == 7
+        assert set(result) <= set(string.hexdigits.lower())
 
     def test_invalid_suffix_raises_error(self):
         """Test invalid suffix type raises ConfigurationError."""
@@ -161,20 +173,74 @@ class TestGenerateBranchSuffix:
             generate_branch_suffix("invalid")
 
 
-class TestStripOrgPrefixFromTeams:
-    """Tests for strip_org_prefix_from_teams function."""
+class TestParseGitDiffOutputZ:
+    """Tests for parse_git_diff_output_z function."""
+
+    def test_status_path_pairs(self):
+        """Test paths are read verbatim, including tabs."""
+        result = parse_git_diff_output_z("M\0README.md\0A\0dir/tab\tname\0")
+        assert result == [("M", "README.md"), ("A", "dir/tab\tname")]
+
+    def test_log_separator(self):
+        """Test the separator git log -z prints before the diff is skipped."""
+        result = parse_git_diff_output_z("\0\nD\0old.txt\0")
+        assert result == [("D", "old.txt")]
 
-    def test_strip_prefix(self):
-        """Test stripping org prefix from teams."""
-        result = strip_org_prefix_from_teams(["org/team1", "org/team2"])
-        assert result == ["team1", "team2"]
+    def test_rename_reports_new_path(self):
+        """Test renames consume both paths and report the new one."""
+        result = parse_git_diff_output_z("R100\0old.txt\0new.txt\0M\0other\0")
+        assert result == [("R100", "new.txt"), ("M", "other")]
 
-    def test_no_prefix(self):
-        """Test teams without prefix remain unchanged."""
-        result = strip_org_prefix_from_teams(["team1", "team2"])
-        assert result == ["team1", "team2"]
+    def test_empty_output(self):
+        """Test empty output yields no changes."""
+        assert parse_git_diff_output_z("") == []
+
+
+class TestStripOrgPrefixFromTeams:
+    """Tests for strip_org_prefix_from_teams function."""
 
-    def test_mixed(self):
-        """Test mixed teams with and without prefix."""
-        result = strip_org_prefix_from_teams(["org/team1", "team2", "other-org/team3"])
-        assert result == ["team1", "team2", "team3"]
+    @pytest.mark.parametrize("teams, expected", [
+        pytest.param(["org/team1", "org/team2"], ["team1", "team2"], id="prefixed"),
+        pytest.param(["team1", "team2"], ["team1", "team2"], id="unprefixed"),
+        pytest.param(
+            ["org/team1", "team2", "other-org/team3"],
+            ["team1", "team2", "team3"],
+            id="mixed"
+        ),
+    ])
+    def test_strip(self, teams, expected):
+        """Test org prefixes are removed and bare team names kept."""
+        assert strip_org_prefix_from_teams(teams) == expected
+
+
+class TestReadFile:
+    """Tests for read_file."""
+
+    def test_limit_counts_characters(self, tmp_path):
+        """Test the limit counts characters, not bytes."""
+        path = tmp_path / "body.md"
+        path.write_text("\u00e9" * 20, encoding="utf-8")
+
+        assert read_file(str(path), limit=10) == "\u00e9" * 10
+
+    @pytest.mark.parametrize("limit", [None, 10])
+    def test_crlf_translated(self, tmp_path, limit):
+        """Test CRLF and CR line endings are read as newlines."""
+        path = tmp_path / "body.md"
+        path.write_bytes(b"a\r\nb\rc\r\n")
+
+        assert read_file(str(path), limit=limit) == "a\nb\nc\n"
+
+
+class TestGetRepoPath:
+    """Tests for get_repo_path."""
+
+    @pytest.mark.parametrize("relative_path, expected", [
+        (None, "/workspace"),
+        (".", "/workspace"),
+        ("sub/repo", "/workspace/sub/repo"),
+    ])
+    def test_resolves_against_workspace(self, monkeypatch, relative_path, expected):
+        """Test paths are resolved relative to GITHUB_WORKSPACE."""
+        monkeypatch.setenv("GITHUB_WORKSPACE", "/workspace")
+        assert get_repo_path(relative_path) == expected